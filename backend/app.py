@@ -12,6 +12,8 @@ from backend.config import get_config
 from backend.services import ImageProcessor, ModelService, PyTorchPredictor
 from backend.utils import (
     error_response,
+    OrjsonProvider,
+    ORJSON_AVAILABLE,
     ModelLoadError,
     setup_logger,
     get_logger,
@@ -33,13 +35,34 @@ _CORS_HEADERS = {
 }
 
 
+# 모든 응답에 공통으로 붙는 헤더 (CORS + 보안) — 응답마다 한 번의 update로 삽입
+_COMMON_HEADERS = {
+    **_CORS_HEADERS,
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+}
+
+# Cache-Control 분류 기준
+_STATIC_SUFFIXES = ('.js', '.css', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico')
+_SHORT_CACHE_PATHS = frozenset({'/', '/health', '/health/ready', '/health/live'})
+
+
 def _add_cors(response):
     """response 에 CORS 헤더를 강제 삽입합니다."""
-    for k, v in _CORS_HEADERS.items():
-        response.headers[k] = v
+    response.headers.update(_CORS_HEADERS)
     return response
 
 
+def _cache_control_for(path: str) -> str:
+    """요청 경로별 Cache-Control 값"""
+    if path.startswith('/static/') or path.endswith(_STATIC_SUFFIXES):
+        return 'public, max-age=31536000, immutable'
+    if path in _SHORT_CACHE_PATHS:
+        return 'public, max-age=60'
+    return 'no-store'
+
+
 def create_app(config_name=None):
     base_dir = os.path.abspath(os.path.dirname(__file__))
     frontend_dir = os.path.abspath(os.path.join(base_dir, '..', 'frontend'))
@@ -49,6 +72,10 @@ def create_app(config_name=None):
     config = get_config(config_name)
     app.config.from_object(config)
 
+    # orjson 설치 시 JSON 직렬화를 orjson으로 교체 (dict 반환/jsonify 모두 적용)
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+
     logger = setup_logger(
         name='aiclassifier',
         log_level=config.LOG_LEVEL,
@@ -96,14 +123,16 @@ def create_app(config_name=None):
     app.image_validator = init_image_validator(
         min_width=32, min_height=32,
         max_width=4096, max_height=4096,
-        max_aspect_ratio=10.0
+        max_aspect_ratio=10.0,
+        max_bytes=config.MAX_CONTENT_LENGTH
     )
 
     app.model_service = ModelService(
         model_path=config.MODEL_PATH,
         labels_path=config.LABELS_PATH,
         enable_cache=getattr(config, 'ENABLE_MODEL_CACHE', True),
-        cache_size=getattr(config, 'MODEL_CACHE_SIZE', 128)
+        cache_size=getattr(config, 'MODEL_CACHE_SIZE', 128),
+        admission_window=getattr(config, 'MODEL_CACHE_ADMISSION_WINDOW', 0)
     )
     try:
         app.model_service.load_model()
@@ -139,13 +168,26 @@ def create_app(config_name=None):
     def request_entity_too_large(error):
         return error_response("파일 크기가 너무 큽니다", status_code=413, error_type="FileTooLargeError")
 
+    # 404/405 본문은 고정값 → 앱 생성 시 1회 직렬화해 재사용 (봇 스캔 등 대량 404 대비)
+    # error_response()와 동일한 필드 구성
+    not_found_body = app.json.dumps({
+        'success': False,
+        'error': "요청한 경로를 찾을 수 없습니다",
+        'error_type': "NotFoundError"
+    }).encode('utf-8')
+    method_not_allowed_body = app.json.dumps({
+        'success': False,
+        'error': "허용되지 않은 메서드입니다",
+        'error_type': "MethodNotAllowedError"
+    }).encode('utf-8')
+
     @app.errorhandler(404)
     def not_found(error):
-        return error_response("요청한 경로를 찾을 수 없습니다", status_code=404, error_type="NotFoundError")
+        return app.response_class(not_found_body, status=404, mimetype=app.json.mimetype)
 
     @app.errorhandler(405)
     def method_not_allowed(error):
-        return error_response("허용되지 않은 메서드입니다", status_code=405, error_type="MethodNotAllowedError")
+        return app.response_class(method_not_allowed_body, status=405, mimetype=app.json.mimetype)
 
     @app.errorhandler(500)
     def internal_server_error(error):
@@ -156,19 +198,9 @@ def create_app(config_name=None):
     # Render 게이트웨이가 CORS 헤더를 제거하는 케이스를 방어합니다.
     @app.after_request
     def force_cors_headers(response):
-        _add_cors(response)
-
-        if request.path.startswith('/static/') or \
-                request.path.endswith(('.js', '.css', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico')):
-            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
-        elif request.path in ['/', '/health', '/health/ready', '/health/live']:
-            response.headers['Cache-Control'] = 'public, max-age=60'
-        else:
-            response.headers['Cache-Control'] = 'no-store'
-
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
+        headers = response.headers
+        headers.update(_COMMON_HEADERS)
+        headers['Cache-Control'] = _cache_control_for(request.path)
         return response
 
     return app
@@ -28,7 +28,10 @@ class Config:
     LABELS_PATH = os.environ.get('LABELS_PATH', str(BASE_DIR / 'models' / 'labels.txt'))
 
     ENABLE_MODEL_CACHE = os.environ.get('ENABLE_MODEL_CACHE', 'true').lower() in ('true', '1', 'yes')
+    # 캐시 계층(텐서·원본 바이트)별 최대 항목 수 — 전체 상한은 2배
     MODEL_CACHE_SIZE = int(os.environ.get('MODEL_CACHE_SIZE', '128'))
+    # 캐시 승인 필터 창 크기 (0: 비활성화 — 첫 예측부터 캐시에 저장)
+    MODEL_CACHE_ADMISSION_WINDOW = int(os.environ.get('MODEL_CACHE_ADMISSION_WINDOW', '0'))
 
     TARGET_IMAGE_SIZE = (224, 224)
     ALLOWED_EXTENSIONS = {'jpg', 'jpeg', 'png'}
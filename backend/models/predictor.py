@@ -5,7 +5,7 @@ PyTorch 의존성을 제거하고 ONNX Runtime을 사용하여 메모리 효율
 """
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 import numpy as np
 import onnxruntime as ort
@@ -18,6 +18,13 @@ from backend.utils import (
     log_exception
 )
 
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    """Logits -> Probabilities (배치 축 기준, 수치 안정화 포함)"""
+    e_x = np.exp(logits - np.max(logits, axis=1, keepdims=True))
+    return e_x / e_x.sum(axis=1, keepdims=True)
+
+
 class ModelPredictor(LoggerMixin):
     """
     ONNX Runtime 예측 클래스 (싱글톤)
@@ -54,6 +61,7 @@ class ModelPredictor(LoggerMixin):
         self.input_name = None
         self.output_name = None
         self.class_names = []
+        self.model_size_mb = 0.0
         
         if model_path and labels_path:
             self.load_model()
@@ -84,6 +92,9 @@ class ModelPredictor(LoggerMixin):
             if not Path(self.model_path).exists():
                 raise FileNotFoundError(f"ONNX 모델 파일을 찾을 수 없습니다: {self.model_path}")
             
+            # 모델 파일 크기는 실행 중 변하지 않으므로 로드 시 1회만 조회 (헬스체크용)
+            self.model_size_mb = round(Path(self.model_path).stat().st_size / (1024 * 1024), 2)
+            
             self.logger.info(f"ONNX Runtime 세션 초기화: {self.model_path}")
             
             # CPU Provider 명시 (Render Free Tier 호환)
@@ -120,23 +131,28 @@ class ModelPredictor(LoggerMixin):
             log_exception(self.logger, e, "모델 로딩 중 오류")
             raise ModelLoadError(f"모델 로딩 실패: {str(e)}", original_error=e)
     
-    def predict(self, image_array: np.ndarray) -> List[Dict[str, Any]]:
+    def predict_arrays(self, image_array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        이미지 배열에 대한 예측 수행
+        이미지 배열에 대한 예측 수행 (SoA 형식)
+        
+        dict 리스트를 만들지 않고 인덱스/확률 배열 쌍을 그대로 반환합니다.
+        ModelService는 이 배열 쌍을 그대로 캐시에 보관하고, 클래스명 매핑
+        (format_predictions)은 라우트가 응답을 만들 때만 수행합니다.
+        반환 배열은 읽기 전용이므로 여러 요청이 복사 없이 공유할 수 있습니다.
         
         Args:
             image_array (np.ndarray): 전처리된 Numpy 배열 (shape: [1, 224, 224, 3])
         
         Returns:
-            List[Dict[str, Any]]: 예측 결과 리스트
-                [{'className': str, 'probability': float}, ...]
+            Tuple[np.ndarray, np.ndarray]: 확률 내림차순으로 정렬된
+                (클래스 인덱스 int32 배열, 확률 float32 배열)
         """
         if not self.is_ready():
             self.logger.error("예측 시도했으나 모델이 준비되지 않음")
             raise ModelNotLoadedError("모델이 아직 로드되지 않았습니다")
         
         try:
-            self.logger.debug(f"예측 시작 (입력 shape: {image_array.shape})")
+            self.logger.debug("예측 시작 (입력 shape: %s)", image_array.shape)
             
             # ONNX Inference
             logits = self.session.run(
@@ -144,38 +160,94 @@ class ModelPredictor(LoggerMixin):
                 {self.input_name: image_array}
             )[0]
             
-            # Softmax 적용 (Logits -> Probabilities)
-            def softmax(x):
-                e_x = np.exp(x - np.max(x))
-                return e_x / e_x.sum(axis=1, keepdims=True)
-            
-            probs = softmax(logits)[0]
-            
-            # 결과 포맷팅
-            results = []
-            for i, probability in enumerate(probs):
-                if i < len(self.class_names):
-                    results.append({
-                        'className': self.class_names[i],
-                        'probability': float(probability)
-                    })
-            
-            # 확률 높은 순으로 정렬
-            results.sort(key=lambda x: x['probability'], reverse=True)
-            
-            if results:
-                top_result = results[0]
-                self.logger.info(
-                    f"예측 완료 - 최고 확률: {top_result['className']} "
-                    f"({top_result['probability']:.4f})"
-                )
-            
-            return results
+            return self._rank(_softmax(logits)[0])
             
         except Exception as e:
             log_exception(self.logger, e, "예측 수행 중 오류")
             raise PredictionError(f"예측 실패: {str(e)}", original_error=e)
     
+    def _rank(self, probs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """단일 샘플 확률 벡터 → 확률 내림차순 (인덱스, 확률) 읽기 전용 배열 쌍"""
+        # 레이블이 존재하는 클래스만 사용
+        probs = probs[:len(self.class_names)].astype(np.float32, copy=False)
+        
+        # 확률 높은 순으로 정렬 (stable → 동률 시 원래 클래스 순서 유지)
+        indices = np.argsort(-probs, kind='stable').astype(np.int32, copy=False)
+        ranked_probs = probs[indices]
+        
+        # 캐시가 복사 없이 공유하므로 호출 측 수정을 차단
+        indices.flags.writeable = False
+        ranked_probs.flags.writeable = False
+        return indices, ranked_probs
+    
+    def predict_batch(self, batch: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        여러 이미지를 한 번의 ONNX 호출로 예측
+        
+        모델 입력의 배치 축이 동적이므로 N장을 묶어 세션 호출·커널 실행
+        오버헤드를 한 번만 지불합니다.
+        
+        Args:
+            batch (np.ndarray): 전처리된 배열 (shape: [N, 224, 224, 3])
+        
+        Returns:
+            List[Tuple[np.ndarray, np.ndarray]]: 입력 순서대로 predict_arrays()와
+                같은 형식의 (인덱스, 확률) 배열 쌍
+        """
+        if not self.is_ready():
+            self.logger.error("예측 시도했으나 모델이 준비되지 않음")
+            raise ModelNotLoadedError("모델이 아직 로드되지 않았습니다")
+        
+        try:
+            self.logger.debug("배치 예측 시작 (입력 shape: %s)", batch.shape)
+            
+            logits = self.session.run(
+                [self.output_name], 
+                {self.input_name: batch}
+            )[0]
+            probs = _softmax(logits)
+            return [self._rank(row) for row in probs]
+            
+        except Exception as e:
+            log_exception(self.logger, e, "배치 예측 수행 중 오류")
+            raise PredictionError(f"배치 예측 실패: {str(e)}", original_error=e)
+    
+    def format_predictions(self, indices: np.ndarray, probs: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        (인덱스, 확률) 배열 쌍을 API 응답용 dict 리스트로 변환
+        
+        Returns:
+            List[Dict[str, Any]]: [{'className': str, 'probability': float}, ...]
+        """
+        class_names = self.class_names
+        return [
+            {'className': class_names[i], 'probability': p}
+            for i, p in zip(indices.tolist(), probs.tolist())
+        ]
+    
+    def predict(self, image_array: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        이미지 배열에 대한 예측 수행
+        
+        Args:
+            image_array (np.ndarray): 전처리된 Numpy 배열 (shape: [1, 224, 224, 3])
+        
+        Returns:
+            List[Dict[str, Any]]: 예측 결과 리스트
+                [{'className': str, 'probability': float}, ...]
+        """
+        indices, probs = self.predict_arrays(image_array)
+        results = self.format_predictions(indices, probs)
+        
+        if results:
+            top_result = results[0]
+            self.logger.info(
+                f"예측 완료 - 최고 확률: {top_result['className']} "
+                f"({top_result['probability']:.4f})"
+            )
+        
+        return results
+    
     def is_ready(self) -> bool:
         """모델이 예측 가능한 상태인지 확인"""
         return self.session is not None and bool(self.class_names)
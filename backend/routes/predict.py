@@ -16,7 +16,6 @@
     CORS 헤더가 포함된 204 응답 즉시 반환.
 """
 
-import io
 import time
 from flask import Blueprint, current_app, request, make_response
 from backend.utils import (
@@ -30,6 +29,7 @@ from backend.utils import (
     get_logger,
     log_exception
 )
+from backend.utils.exceptions import AIClassifierException
 
 predict_bp = Blueprint('predict', __name__)
 
@@ -47,6 +47,28 @@ CORS_HEADERS = {
     'Access-Control-Max-Age':       '3600',
 }
 
+# 예외 타입 → (HTTP 상태, traceback 로깅 여부, 로그 컨텍스트, 고정 메시지, original_error 포함 여부)
+# 고정 메시지가 None이면 예외 메시지를 그대로 응답합니다.
+_ERROR_HANDLERS = {
+    ModelNotLoadedError:  (503, True,  "모델 미준비",         None, False),
+    FileValidationError:  (400, False, "파일 검증 실패",       None, False),
+    InvalidImageError:    (400, False, "유효하지 않은 이미지",  None, False),
+    ImageProcessingError: (422, True,  "이미지 처리 오류",     None, True),
+    PredictionError:      (500, True,  "예측 오류",           "예측 중 오류가 발생했습니다", True),
+}
+
+
+def _resolve_error_handler(exc: AIClassifierException):
+    """예외 타입의 MRO를 따라 가장 가까운 _ERROR_HANDLERS 항목 조회 (하위 클래스도 매칭)"""
+    return next(
+        (h for t in type(exc).__mro__ if (h := _ERROR_HANDLERS.get(t)) is not None),
+        None
+    )
+
+
+def _internal_error_response():
+    return error_response("서버 내부 오류가 발생했습니다", status_code=500, error_type="InternalServerError")
+
 
 @predict_bp.route("/predict", methods=['POST', 'OPTIONS'])
 def predict():
@@ -64,7 +86,7 @@ def predict():
         return resp
 
     # ── POST 요청 처리 ──────────────────────────────────────────────────
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     model_service   = current_app.model_service
     image_processor = current_app.image_processor
@@ -91,18 +113,20 @@ def predict():
         if not is_valid:
             raise FileValidationError(error_msg)
 
-        request_logger.info(f"📄 파일 수신: {file.filename}")
+        request_logger.info("📄 파일 수신: %s", file.filename)
 
-        in_memory_file = io.BytesIO()
-        file.save(in_memory_file)
-        in_memory_file.seek(0)
-        image_bytes = in_memory_file.read()
+        # 업로드 스트림에서 직접 읽기 (중간 BytesIO 복사 없음)
+        image_bytes = file.read()
 
         if image_validator:
             image_validator.comprehensive_validation(image_bytes)
 
-        processed_image = image_processor.preprocess(image_bytes)
-        predictions, from_cache = model_service.predict(processed_image)
+        # 원본 바이트 캐시 히트 시 전처리·추론 모두 생략
+        ranked, from_cache = model_service.predict_from_bytes(
+            image_bytes, image_processor.preprocess
+        )
+        # (인덱스, 확률) 배열 → 응답용 dict 리스트 (응답 직전 1회만 변환)
+        predictions = model_service.format_predictions(ranked)
 
         gradcam_result = {
             "available": False, "error": "Grad-CAM 서비스 미초기화",
@@ -115,19 +139,20 @@ def predict():
                 existing_predictions=predictions,
             )
 
-        total_time_ms   = (time.time() - start_time) * 1000
+        total_time_ms   = (time.perf_counter_ns() - start_ns) / 1e6
         gradcam_time_ms = gradcam_result.get("gradcam_time_ms", 0.0)
         onnx_time_ms    = round(total_time_ms - gradcam_time_ms, 2)
 
         top_result  = predictions[0]
         cache_label = "캐시 히트" if from_cache else "추론"
         request_logger.info(
-            f"✅ 예측 완료 [{cache_label}] - {file.filename}: "
-            f"{top_result['className']} ({top_result['probability']:.4f}) "
-            f"[전체={total_time_ms:.0f}ms | ONNX={onnx_time_ms:.0f}ms | "
-            f"GradCAM={gradcam_time_ms:.0f}ms] "
-            f"gradcam={gradcam_result.get('available', False)} "
-            f"low_conf={gradcam_result.get('low_confidence', False)}"
+            "✅ 예측 완료 [%s] - %s: %s (%.4f) "
+            "[전체=%.0fms | ONNX=%.0fms | GradCAM=%.0fms] gradcam=%s low_conf=%s",
+            cache_label, file.filename,
+            top_result['className'], top_result['probability'],
+            total_time_ms, onnx_time_ms, gradcam_time_ms,
+            gradcam_result.get('available', False),
+            gradcam_result.get('low_confidence', False)
         )
 
         return {
@@ -147,27 +172,21 @@ def predict():
             'gradcam': gradcam_result,
         }, 200
 
-    except ModelNotLoadedError as e:
-        log_exception(request_logger, e, "모델 미준비")
-        return error_response(e.message, status_code=503, error_type=e.error_code)
-    except FileValidationError as e:
-        request_logger.warning(f"파일 검증 실패: {e.message}")
-        return error_response(e.message, status_code=400, error_type=e.error_code)
-    except InvalidImageError as e:
-        request_logger.warning(f"유효하지 않은 이미지: {e.message}")
-        return error_response(e.message, status_code=400, error_type=e.error_code)
-    except ImageProcessingError as e:
-        log_exception(request_logger, e, "이미지 처리 오류")
-        return error_response(
-            e.message, status_code=422, error_type=e.error_code,
-            details={"original_error": str(e.original_error)} if getattr(e, 'original_error', None) else None
-        )
-    except PredictionError as e:
-        log_exception(request_logger, e, "예측 오류")
+    except AIClassifierException as e:
+        handler = _resolve_error_handler(e)
+        if handler is None:
+            log_exception(request_logger, e, "예상치 못한 오류")
+            return _internal_error_response()
+        status_code, log_traceback, context, message, with_original = handler
+        if log_traceback:
+            log_exception(request_logger, e, context)
+        else:
+            request_logger.warning("%s: %s", context, e.message)
+        original_error = e.original_error if with_original else None
         return error_response(
-            "예측 중 오류가 발생했습니다", status_code=500, error_type=e.error_code,
-            details={"original_error": str(e.original_error)} if getattr(e, 'original_error', None) else None
+            message or e.message, status_code=status_code, error_type=e.error_code,
+            details={"original_error": str(original_error)} if original_error else None
         )
     except Exception as e:
         log_exception(request_logger, e, "예상치 못한 오류")
-        return error_response("서버 내부 오류가 발생했습니다", status_code=500, error_type="InternalServerError")
+        return _internal_error_response()
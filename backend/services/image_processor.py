@@ -5,6 +5,7 @@
 """
 
 import io
+import threading
 from typing import Tuple
 
 import numpy as np
@@ -33,8 +34,21 @@ class ImageProcessor(LoggerMixin):
             target_size (Tuple[int, int]): 리사이즈할 이미지 크기 (width, height)
         """
         self.target_size = target_size
+        
+        # 스레드별 전처리 출력 버퍼 (요청마다 float32 배열을 새로 할당하지 않음)
+        self._buffer_shape = (1, target_size[1], target_size[0], 3)
+        self._tls = threading.local()
+        
         self.logger.info(f"ImageProcessor 초기화 (target_size: {target_size})")
     
+    def _get_buffer(self) -> np.ndarray:
+        """현재 스레드의 전처리 출력 버퍼 반환 (최초 호출 시 할당)"""
+        buf = getattr(self._tls, 'buf', None)
+        if buf is None:
+            buf = np.empty(self._buffer_shape, dtype=np.float32)
+            self._tls.buf = buf
+        return buf
+    
     def preprocess(self, image_bytes: bytes) -> np.ndarray:
         """
         이미지 바이트를 모델 입력 형식으로 전처리
@@ -44,10 +58,14 @@ class ImageProcessor(LoggerMixin):
         
         Returns:
             np.ndarray: 전처리된 배열 (shape: [1, 224, 224, 3])
+                스레드별 버퍼를 재사용하므로, 같은 스레드에서 다음
+                preprocess()가 호출되기 전까지만 유효합니다.
         """
         try:
-            tensor = preprocess_bytes_to_tensor(image_bytes, self.target_size)
-            self.logger.debug(f"전처리 완료: shape={tensor.shape}, dtype={tensor.dtype}")
+            tensor = preprocess_bytes_to_tensor(
+                image_bytes, self.target_size, out=self._get_buffer()
+            )
+            self.logger.debug("전처리 완료: shape=%s, dtype=%s", tensor.shape, tensor.dtype)
             return tensor
             
         except (InvalidImageError, ImageProcessingError):
@@ -70,19 +88,14 @@ class ImageProcessor(LoggerMixin):
             np.ndarray: 전처리된 배열
         """
         try:
-            # 메모리에 파일 읽기
-            in_memory_file = io.BytesIO()
-            file_storage.save(in_memory_file)
-            in_memory_file.seek(0)
-            
-            # 바이트로 읽어서 전처리
-            image_bytes = in_memory_file.read()
+            # 업로드 스트림에서 바이트로 직접 읽기 (중간 BytesIO 복사 없음)
+            image_bytes = file_storage.read()
             
             if len(image_bytes) == 0:
                 self.logger.error("빈 파일이 업로드됨")
                 raise InvalidImageError("빈 파일입니다")
             
-            self.logger.debug(f"파일 읽기 완료 ({len(image_bytes)} bytes)")
+            self.logger.debug("파일 읽기 완료 (%d bytes)", len(image_bytes))
             
             return self.preprocess(image_bytes)
             
@@ -16,22 +16,50 @@ PyTorch 모델의 로딩, 캐싱, 예측을 담당하는 서비스 레이어입
     predict() → _get_from_cache(hash)  ← self._cache dict 직접 조회
                   └─ hit이면 즉시 반환
                 _save_to_cache(hash, result) → self._cache[hash] = result
-                  └─ OrderedDict 기반 LRU 정책 적용
-    반환값: (predictions, from_cache: bool)  ← app.py에서 사용 가능
+                  └─ 접근 카운터 기반 LRU 정책 적용
+    반환값: (ranked, from_cache: bool)  ← ranked는 (인덱스, 확률) 배열 쌍
+            dict 변환은 라우트에서 format_predictions()로 응답 직전에만 수행
 ─────────────────────────────────────────
 """
 
 import time
 import hashlib
-from collections import OrderedDict
-from typing import Dict, List, Optional, Tuple
+import itertools
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-import numpy as np
+
+# 캐시 키 해시 백엔드 (우선순위: xxh3_128 → BLAKE3 → hashlib.sha256)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
 from backend.models import ModelPredictor
 from backend.utils import get_logger, ModelLoadError, PredictionError
 
+# 캐시 키 길이 (128-bit) — 암호학적 용도가 아닌 LRU 키이므로 충분
+CACHE_KEY_BYTES = 16
+
+# SHA-256 폴백용 초기화 완료 객체 — 호출마다 생성자 대신 .copy()로 복제
+# (xxh3는 생성자가 .copy()보다 빨라 템플릿을 두지 않음)
+# usedforsecurity=False: 캐시 키 용도임을 명시 → FIPS 모드 OpenSSL에서도 차단되지 않음
+_SHA256_TEMPLATE = hashlib.sha256(usedforsecurity=False)
+
+# 예측 결과 형태: (클래스 인덱스 int32 배열, 확률 float32 배열) — 확률 내림차순
+# - predictor가 읽기 전용 배열로 반환하므로 캐시 항목을 복사 없이 그대로 공유
+# - dict 리스트는 응답 직전(format_predictions)에서만 생성
+RankedPredictions = Tuple[np.ndarray, np.ndarray]
+
 
 class ModelService:
     """
@@ -39,7 +67,7 @@ class ModelService:
 
     역할:
     - 모델 로딩 및 라이프사이클 관리
-    - 예측 결과 캐싱 (OrderedDict 기반 LRU)
+    - 예측 결과 캐싱 (접근 카운터 기반 LRU)
     - 모델 워밍업 및 성능 최적화
     - 통계 및 메트릭 수집
     """
@@ -49,36 +77,70 @@ class ModelService:
         model_path: str,
         labels_path: str,
         enable_cache: bool = True,
-        cache_size: int = 128
+        cache_size: int = 128,
+        admission_window: int = 0
     ):
         """
         Args:
             model_path: 모델 파일 경로 (.pt 지원, 없으면 pretrained 사용)
             labels_path: 레이블 파일 경로
             enable_cache: 예측 캐싱 활성화 여부
-            cache_size: LRU 캐시 최대 크기
+            cache_size: LRU 캐시 계층별 최대 크기
+                        — 텐서 캐시·원본 바이트 캐시가 각각 최대 cache_size개를
+                          보관하므로 전체 항목 수 상한은 2 × cache_size
+            admission_window: 캐시 승인 필터 크기 (0이면 비활성화)
+                              — 계층별로 최근 N개 키 안에서 두 번째로 관측된 키만 저장
         """
         self.model_path = model_path
         self.labels_path = labels_path
         self.enable_cache = enable_cache
         self.cache_size = cache_size
+        self.admission_window = admission_window
 
         self.logger = get_logger('aiclassifier.model_service')
 
         # 내부 ModelPredictor 인스턴스
         self._predictor: Optional[ModelPredictor] = None
 
-        # OrderedDict 기반 LRU 캐시
-        # - 조회·저장 시 해당 키를 end로 이동
-        # - 크기 초과 시 가장 앞(오래된 항목)을 제거
-        self._cache: OrderedDict = OrderedDict()
+        # 접근 카운터 기반 LRU 캐시
+        # - 값은 [(인덱스, 확률) 읽기 전용 배열 쌍, 마지막 접근 카운터] 2-원소 리스트
+        # - 히트 시 카운터만 갱신 (dict 구조 변경·락 없음)
+        # - 크기 초과 시 저장 시점에만 카운터 최솟값(가장 오래전 접근) 항목 제거
+        self._cache: Dict[bytes, list] = {}
+
+        # 원본 업로드 바이트 해시 → 예측 결과 (전처리 이전 단계 캐시)
+        # 동일 파일 재업로드 시 디코딩·리사이즈·정규화까지 건너뜁니다.
+        # 텐서 캐시와 별도로 최대 cache_size개를 보관합니다.
+        self._raw_cache: Dict[bytes, list] = {}
+
+        # 전역 접근 카운터 (itertools.count의 next()는 GIL 하에서 원자적)
+        self._access_clock = itertools.count()
+
+        # 캐시 승인 필터 (doorkeeper) — 최근 관측 키 FIFO + 멤버십 set
+        # - 한 번만 등장하는 이미지가 자주 쓰이는 항목을 퇴장시키지 않도록 함
+        # - 요청 1건이 원본·텐서 키를 하나씩 관측하므로 계층별로 따로 두어
+        #   각 계층의 창이 admission_window개 요청을 온전히 덮도록 함
+        # - _cache_lock 보유 상태에서만 변경
+        self._admission_queue: deque = deque()
+        self._admission_seen: set = set()
+        self._raw_admission_queue: deque = deque()
+        self._raw_admission_seen: set = set()
+
+        # 캐시 구조 변경(setitem / del) 보호용 락
+        # - gthread 워커의 동시 저장·퇴장이 크기 제한을 깨뜨리지 않도록 함
+        # - 조회·추론·해시·로깅은 락 밖에서 수행 (임계 구역은 저장·퇴장만)
+        self._cache_lock = threading.RLock()
+
+        # 통계 카운터 갱신 보호용 락
+        # - dict 항목의 += 는 read-modify-write이므로 동시 요청 시 카운트 유실 가능
+        self._stats_lock = threading.Lock()
 
         # 통계
         self.stats = {
             'total_predictions': 0,
             'cache_hits': 0,
             'cache_misses': 0,
-            'total_inference_time_ms': 0.0,
+            'total_inference_time_ns': 0,
             'warmup_completed': False
         }
 
@@ -113,11 +175,13 @@ class ModelService:
             self.logger.info("🔥 모델 워밍업 시작...")
 
             # 더미 입력 생성 (1, 224, 224, 3) — ONNX Runtime NHWC 포맷
-            dummy_input = np.random.rand(1, 224, 224, 3).astype(np.float32)
+            # 값은 무의미하므로 난수 생성·float64→float32 복사 없이 0으로 채움
+            # (np.empty는 NaN/Inf가 섞일 수 있어 사용하지 않음)
+            dummy_input = np.zeros((1, 224, 224, 3), dtype=np.float32)
 
-            start_time = time.time()
-            _ = self._predictor.predict(dummy_input)
-            warmup_time = (time.time() - start_time) * 1000
+            start_ns = time.perf_counter_ns()
+            _ = self._predictor.predict_arrays(dummy_input)
+            warmup_time = (time.perf_counter_ns() - start_ns) / 1e6
 
             self.stats['warmup_completed'] = True
             self.logger.info(f"✓ 모델 워밍업 완료 ({warmup_time:.0f}ms)")
@@ -134,102 +198,320 @@ class ModelService:
     def predict(
         self,
         processed_image,
-        use_cache: Optional[bool] = None
-    ) -> Tuple[List[Dict[str, any]], bool]:
+        use_cache: Optional[bool] = None,
+        cache_key: Optional[bytes] = None
+    ) -> Tuple[RankedPredictions, bool]:
         """
         이미지 예측 (캐싱 지원)
 
         Args:
             processed_image: 전처리된 이미지 (torch.Tensor 또는 numpy array)
             use_cache: 캐시 사용 여부 (None이면 기본 설정 따름)
+            cache_key: 호출 측에서 이미 계산한 캐시 키
+                       (지정 시 전처리 텐서 해시를 생략)
 
         Returns:
-            (predictions, from_cache)
-              - predictions : 예측 결과 리스트
-              - from_cache   : True이면 캐시에서 반환된 결과
+            (ranked, from_cache)
+              - ranked     : (클래스 인덱스, 확률) 읽기 전용 배열 쌍
+                             — API 응답 형식은 format_predictions()로 변환
+              - from_cache : True이면 캐시에서 반환된 결과
         """
         if not self.is_ready():
             raise PredictionError("모델이 로드되지 않았습니다")
 
-        self.stats['total_predictions'] += 1
         should_use_cache = use_cache if use_cache is not None else self.enable_cache
+        stats = self.stats
 
         # ── 캐시 조회 ──────────────────────────────────────────
         if should_use_cache:
-            image_hash = self._compute_image_hash(processed_image)
+            image_hash = (
+                cache_key if cache_key is not None
+                else self._compute_image_hash(processed_image)
+            )
             cached = self._get_from_cache(image_hash)
 
             if cached is not None:
-                self.stats['cache_hits'] += 1
-                self.logger.debug(f"✓ 캐시 히트 (해시: {image_hash[:8]}...)")
+                with self._stats_lock:
+                    stats['total_predictions'] += 1
+                    stats['cache_hits'] += 1
+                self.logger.debug("✓ 캐시 히트 (해시: %s...)", image_hash[:4].hex())
                 return cached, True          # ← from_cache = True
 
-            self.stats['cache_misses'] += 1
+            with self._stats_lock:
+                stats['total_predictions'] += 1
+                stats['cache_misses'] += 1
+        else:
+            with self._stats_lock:
+                stats['total_predictions'] += 1
 
         # ── 실제 추론 ──────────────────────────────────────────
-        start_time = time.time()
-        predictions = self._predictor.predict(processed_image)
-        inference_time = (time.time() - start_time) * 1000
-        self.stats['total_inference_time_ms'] += inference_time
+        # 단조 정수 클럭 → ms 변환은 get_statistics()에서만 수행
+        start_ns = time.perf_counter_ns()
+        ranked = self._predictor.predict_arrays(processed_image)
+        inference_ns = time.perf_counter_ns() - start_ns
+        with self._stats_lock:
+            stats['total_inference_time_ns'] += inference_ns
 
         # ── 캐시 저장 ──────────────────────────────────────────
         if should_use_cache:
-            self._save_to_cache(image_hash, predictions)
+            self._save_to_cache(image_hash, ranked)
+
+        return ranked, False                 # ← from_cache = False
+
+    def predict_from_bytes(
+        self,
+        image_bytes: bytes,
+        preprocess: Callable[[bytes], np.ndarray],
+        use_cache: Optional[bool] = None
+    ) -> Tuple[RankedPredictions, bool]:
+        """
+        원본 이미지 바이트 예측 (전처리 이전 단계 캐싱)
+
+        원본 바이트 해시로 먼저 캐시를 조회하고, 미스일 때만
+        preprocess를 호출한 뒤 predict()(텐서 캐시)로 위임합니다.
+
+        Args:
+            image_bytes: 업로드된 원본 이미지 바이트
+            preprocess: 이미지 바이트 → 모델 입력 배열 변환 함수
+            use_cache: 캐시 사용 여부 (None이면 기본 설정 따름)
+
+        Returns:
+            (ranked, from_cache) — predict()와 동일
+        """
+        should_use_cache = use_cache if use_cache is not None else self.enable_cache
+        if not should_use_cache:
+            return self.predict(preprocess(image_bytes), use_cache=False)
 
-        return predictions, False            # ← from_cache = False
+        if not self.is_ready():
+            raise PredictionError("모델이 로드되지 않았습니다")
+
+        raw_hash = self._compute_image_hash(image_bytes)
+        cached = self._get_from_cache(raw_hash, self._raw_cache)
+        if cached is not None:
+            with self._stats_lock:
+                self.stats['total_predictions'] += 1
+                self.stats['cache_hits'] += 1
+            self.logger.debug("✓ 원본 캐시 히트 (해시: %s...)", raw_hash[:4].hex())
+            return cached, True
 
-    # ─── 캐시 내부 구현 (OrderedDict LRU) ─────────────────────────
+        ranked, from_cache = self.predict(preprocess(image_bytes), use_cache=True)
+        self._save_to_cache(raw_hash, ranked, self._raw_cache)
+        return ranked, from_cache
 
-    def _compute_image_hash(self, image_array) -> str:
+    def predict_batch(
+        self,
+        batch: np.ndarray,
+        use_cache: Optional[bool] = None
+    ) -> List[Tuple[RankedPredictions, bool]]:
         """
-        이미지 배열의 해시값 계산 (SHA-256)
+        배치 배열 일괄 예측 (캐시 미스만 모아 1회 추론)
+
+        캐시 히트와 배치 내 중복 이미지는 추론 대상에서 제외하고,
+        남은 행만 predictor.predict_batch()로 한 번에 추론합니다.
+
+        입력은 preprocess_batch()가 만든 단일 [N, H, W, 3] 배열입니다.
+        배열 리스트를 받지 않는 이유: ImageProcessor.preprocess()는 스레드별
+        버퍼를 재사용하므로, 호출 결과를 리스트로 모으면 모든 원소가 같은
+        배열(마지막 이미지)을 가리키게 됩니다.
+
+        Args:
+            batch: 전처리된 배치 배열 (shape: [N, H, W, 3])
+            use_cache: 캐시 사용 여부 (None이면 기본 설정 따름)
+
+        Returns:
+            입력 행 순서대로 (ranked, from_cache) 리스트 — predict()와 동일
+        """
+        if not self.is_ready():
+            raise PredictionError("모델이 로드되지 않았습니다")
+
+        batch = np.ascontiguousarray(batch)
+        count = batch.shape[0]
+        should_use_cache = use_cache if use_cache is not None else self.enable_cache
+        results: List[Optional[Tuple[RankedPredictions, bool]]] = [None] * count
+
+        # 추론 대상: 키 → 결과를 받을 행 번호 목록 (첫 행을 추론에 사용)
+        pending: Dict[object, List[int]] = {}
+        for i in range(count):
+            if not should_use_cache:
+                pending[i] = [i]
+                continue
+            # [1, H, W, 3] 행 뷰 — predict()와 같은 키가 나오도록 배치 축 유지
+            image_hash = self._compute_image_hash(batch[i:i + 1])
+            cached = self._get_from_cache(image_hash)
+            if cached is not None:
+                results[i] = (cached, True)
+            elif image_hash in pending:
+                pending[image_hash].append(i)
+            else:
+                pending[image_hash] = [i]
+
+        misses = len(pending)
+        with self._stats_lock:
+            self.stats['total_predictions'] += count
+            if should_use_cache:
+                self.stats['cache_hits'] += count - misses
+                self.stats['cache_misses'] += misses
+
+        if not pending:
+            return results
+
+        rows = [positions[0] for positions in pending.values()]
+        # 모든 행이 추론 대상이면 복사 없이 그대로 전달
+        miss_batch = batch if misses == count else batch[rows]
+        start_ns = time.perf_counter_ns()
+        batch_predictions = self._predictor.predict_batch(miss_batch)
+        inference_ns = time.perf_counter_ns() - start_ns
+        with self._stats_lock:
+            self.stats['total_inference_time_ns'] += inference_ns
+
+        for (key, positions), ranked in zip(pending.items(), batch_predictions):
+            if should_use_cache:
+                self._save_to_cache(key, ranked)
+            results[positions[0]] = (ranked, False)
+            # 배치 내 중복 이미지는 같은 (읽기 전용) 결과를 캐시 히트로 반환
+            for i in positions[1:]:
+                results[i] = (ranked, True)
+
+        self.logger.debug("배치 예측 완료 (입력 %d장, 추론 %d장)", count, misses)
+        return results
+
+    # ─── 캐시 내부 구현 (접근 카운터 LRU) ─────────────────────────
+
+    def _compute_image_hash(self, image_array) -> bytes:
+        """
+        이미지 배열의 해시값 계산 (xxh3_128 → BLAKE3 → SHA-256)
 
         numpy 배열의 바이트 표현이 동일하면 해시도 동일하므로,
         동일한 이미지에 대한 캐시 조회가 정확히 동작합니다.
+        원본 업로드 바이트(bytes)도 그대로 해시합니다.
+
+        캐시 키는 암호학적 성질이 필요 없으므로 설치되어 있으면
+        비암호 해시(xxh3)를 우선 사용합니다. 모든 경로가 tobytes() 복사 없이
+        memoryview를 그대로 해시하며, 키는 128-bit(16바이트) raw digest로
+        통일됩니다. hex 문자열 변환 없이 bytes를 그대로 dict 키로 사용합니다.
+
+        배열은 dtype·shape를 함께 해시하여, 바이트가 같더라도
+        형태가 다른 텐서끼리 키가 충돌하지 않도록 합니다.
+        전체 버퍼를 해시합니다 — 일부 픽셀만 샘플링하면 작은 병변만 다른
+        두 영상이 같은 키를 가질 수 있어 의료 영상 캐시에는 부적합합니다.
         """
         try:
+            header = b''
             if isinstance(image_array, np.ndarray):
-                buf = image_array.tobytes()
+                header = f"{image_array.dtype.str}{image_array.shape}".encode('ascii')
+                # 전처리 결과는 이미 C-contiguous → 복사 없이 버퍼 그대로 사용
+                if not image_array.flags['C_CONTIGUOUS']:
+                    image_array = np.ascontiguousarray(image_array)
+                buf = memoryview(image_array).cast('B')
+            elif isinstance(image_array, (bytes, bytearray, memoryview)):
+                buf = image_array
             else:
                 # 알 수 없는 타입은 문자열 표현으로 해시
                 buf = str(image_array).encode('utf-8')
-            return hashlib.sha256(buf).hexdigest()
+
+            if XXHASH_AVAILABLE:
+                hasher = xxhash.xxh3_128()
+            elif BLAKE3_AVAILABLE:
+                hasher = blake3.blake3()
+            else:
+                hasher = _SHA256_TEMPLATE.copy()
+            hasher.update(header)
+            hasher.update(buf)
+            # BLAKE3 / SHA-256은 앞 128-bit만 사용 (BLAKE3는 length=16 출력과 동일)
+            return hasher.digest()[:CACHE_KEY_BYTES]
         except Exception:
             # 해시 실패 시 랜덤 값으로 충돌 최소화
-            return hashlib.sha256(np.random.rand(32).tobytes()).hexdigest()
+            return np.random.bytes(CACHE_KEY_BYTES)
 
-    def _get_from_cache(self, image_hash: str) -> Optional[List[Dict]]:
+    def _get_from_cache(
+        self,
+        image_hash: bytes,
+        cache: Optional[Dict[bytes, list]] = None
+    ) -> Optional[RankedPredictions]:
         """
-        캐시 조회 + LRU 순서 갱신
+        캐시 조회 + 접근 카운터 갱신
 
-        조회된 키를 OrderedDict의 end로 이동하여
-        최근 사용된 항목이 제거되지 않도록 합니다.
+        히트 시 항목의 접근 카운터만 최신 값으로 덮어씁니다.
+        dict 구조를 바꾸지 않으므로 락 없이 수행되며, 조회 직후 다른
+        스레드가 항목을 퇴장시켜도 이미 얻은 값은 그대로 유효합니다.
+        저장된 배열은 읽기 전용이므로 복사 없이 그대로 반환합니다.
+        cache를 생략하면 텐서 캐시(self._cache)를 사용합니다.
         """
-        if image_hash not in self._cache:
+        if cache is None:
+            cache = self._cache
+
+        entry = cache.get(image_hash)
+        if entry is None:
             return None
 
-        # move_to_end → 최근 사용 시간 갱신
-        self._cache.move_to_end(image_hash)
-        return self._cache[image_hash]
+        # 최근 사용 시간 갱신 (리스트 원소 대입은 GIL 하에서 원자적)
+        entry[1] = next(self._access_clock)
+        return entry[0]
 
-    def _save_to_cache(self, image_hash: str, predictions: List[Dict]) -> None:
+    def _save_to_cache(
+        self,
+        image_hash: bytes,
+        ranked: RankedPredictions,
+        cache: Optional[Dict[bytes, list]] = None
+    ) -> None:
         """
         캐시 저장 + LRU 정책 적용
 
-        크기 초과 시 가장 오래된 항목(begin)을 제거합니다.
+        크기 초과 시 접근 카운터가 가장 작은(가장 오래전에 사용된) 항목을
+        제거합니다. 퇴장 후보 탐색은 O(cache_size)이지만 저장(미스) 시에만
+        수행되며, 카운터가 같으면 먼저 삽입된 항목이 제거됩니다.
+        cache를 생략하면 텐서 캐시(self._cache)를 사용합니다.
         """
-        # 이미 존재하면 값 갱신 + end로 이동
-        if image_hash in self._cache:
-            self._cache.move_to_end(image_hash)
-            self._cache[image_hash] = predictions
-            return
+        if cache is None:
+            cache = self._cache
 
-        # 새 항목 추가
-        self._cache[image_hash] = predictions
+        entry = [ranked, next(self._access_clock)]
 
-        # LRU 퇴장: 크기 초과 시 begin(oldest) 제거
-        while len(self._cache) > self.cache_size:
-            self._cache.popitem(last=False)
+        with self._cache_lock:
+            if (
+                self.admission_window > 0
+                and image_hash not in cache
+                and not self._admit(image_hash, cache)
+            ):
+                return
+
+            cache[image_hash] = entry
+
+            # LRU 퇴장: 크기 초과 시 카운터 최솟값 항목 제거
+            while len(cache) > self.cache_size:
+                del cache[min(cache, key=lambda k: cache[k][1])]
+
+    def _admit(self, image_hash: bytes, cache: Dict[bytes, list]) -> bool:
+        """
+        캐시 승인 여부 판단 (_cache_lock 보유 상태에서 호출)
+
+        해당 캐시 계층의 최근 admission_window개 키 안에서 이미 관측된
+        키면 승인합니다. 처음 보는 키는 기록만 하고 거절하며, 창이 가득
+        차면 가장 오래된 관측 기록을 제거합니다.
+        """
+        if cache is self._raw_cache:
+            queue, seen = self._raw_admission_queue, self._raw_admission_seen
+        else:
+            queue, seen = self._admission_queue, self._admission_seen
+
+        if image_hash in seen:
+            return True
+
+        if len(queue) >= self.admission_window:
+            seen.discard(queue.popleft())
+        queue.append(image_hash)
+        seen.add(image_hash)
+        return False
+
+    # ─── 응답 변환 ────────────────────────────────────────────────
+
+    def format_predictions(self, ranked: RankedPredictions) -> List[Dict[str, any]]:
+        """
+        (인덱스, 확률) 배열 쌍 → API 응답용 dict 리스트
+
+        라우트가 JSON 응답을 만들 때만 호출합니다.
+        """
+        return self._predictor.format_predictions(*ranked)
 
     # ─── 모델 정보 / 통계 ─────────────────────────────────────────
 
@@ -250,13 +532,16 @@ class ModelService:
         Returns:
             캐시 히트율, 평균 추론 시간 등 통계 딕셔너리
         """
-        total = self.stats['total_predictions']
-        hits = self.stats['cache_hits']
-        misses = self.stats['cache_misses']
+        with self._stats_lock:
+            total = self.stats['total_predictions']
+            hits = self.stats['cache_hits']
+            misses = self.stats['cache_misses']
+            total_inference_time_ns = self.stats['total_inference_time_ns']
 
         cache_hit_rate = (hits / total * 100) if total > 0 else 0.0
+        total_inference_time_ms = total_inference_time_ns / 1e6
         avg_inference_time = (
-            self.stats['total_inference_time_ms'] / misses
+            total_inference_time_ms / misses
         ) if misses > 0 else 0.0
 
         return {
@@ -267,22 +552,38 @@ class ModelService:
             'cache_misses': misses,
             'cache_hit_rate_percent': round(cache_hit_rate, 2),
             'avg_inference_time_ms': round(avg_inference_time, 2),
-            'total_inference_time_ms': round(self.stats['total_inference_time_ms'], 2),
+            'total_inference_time_ms': round(total_inference_time_ms, 2),
             'warmup_completed': self.stats['warmup_completed']
         }
 
     def clear_cache(self) -> None:
         """캐시 초기화"""
-        self._cache.clear()
-        self.stats['cache_hits'] = 0
-        self.stats['cache_misses'] = 0
+        with self._cache_lock:
+            self._cache.clear()
+            self._raw_cache.clear()
+            self._admission_queue.clear()
+            self._admission_seen.clear()
+            self._raw_admission_queue.clear()
+            self._raw_admission_seen.clear()
+        with self._stats_lock:
+            self.stats['cache_hits'] = 0
+            self.stats['cache_misses'] = 0
         self.logger.info("✓ 캐시 초기화 완료")
 
     def get_cache_info(self) -> Dict[str, int]:
-        """캐시 정보 조회"""
+        """
+        캐시 정보 조회
+
+        maxsize / currsize는 텐서·원본 바이트 두 계층의 합계이며,
+        계층별 항목 수는 tensor_currsize / raw_currsize로 제공합니다.
+        """
+        tensor_size = len(self._cache)
+        raw_size = len(self._raw_cache)
         return {
             'hits': self.stats['cache_hits'],
             'misses': self.stats['cache_misses'],
-            'maxsize': self.cache_size,
-            'currsize': len(self._cache)
+            'maxsize': 2 * self.cache_size,
+            'currsize': tensor_size + raw_size,
+            'tensor_currsize': tensor_size,
+            'raw_currsize': raw_size
         }
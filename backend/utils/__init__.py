@@ -3,12 +3,14 @@
 Contains helper functions and utility modules.
 """
 
+from importlib import import_module
+
 # 검증 관련
 from .validators import validate_file
-from .advanced_validators import init_image_validator, get_image_validator
 
 # 응답 관련
 from .responses import error_response
+from .json_provider import OrjsonProvider, ORJSON_AVAILABLE
 
 # 예외 관련
 from .exceptions import (
@@ -23,8 +25,28 @@ from .exceptions import (
 # 로깅 관련
 from .logger import setup_logger, get_logger, log_exception, LoggerMixin
 
-# 헬스체크 관련
-from .health import init_health_checker, get_health_checker
+# 지연 로딩 대상 (PEP 562)
+# - advanced_validators(PIL), health(psutil)는 임포트 비용이 커서
+#   예외·로거만 필요한 모듈(models.predictor 등)에서는 불러오지 않도록
+#   첫 접근 시점에 로드합니다.
+_LAZY_ATTRS = {
+    # 검증
+    'init_image_validator': '.advanced_validators',
+    'get_image_validator': '.advanced_validators',
+    # 헬스체크
+    'init_health_checker': '.health',
+    'get_health_checker': '.health',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # 검증
@@ -33,6 +55,8 @@ __all__ = [
     'get_image_validator',
     # 응답
     'error_response',
+    'OrjsonProvider',
+    'ORJSON_AVAILABLE',
     # 예외
     'ModelNotLoadedError',
     'ModelLoadError',
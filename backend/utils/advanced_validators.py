@@ -5,6 +5,7 @@
 """
 
 import io
+import struct
 import logging
 from typing import Tuple, Optional
 from PIL import Image
@@ -12,6 +13,9 @@ from PIL import Image
 from .exceptions import InvalidImageError
 
 
+logger = logging.getLogger('aiclassifier.validation')
+
+
 class ImageValidator:
     """
     고급 이미지 검증기
@@ -38,9 +42,26 @@ class ImageValidator:
         'gif':  [b'GIF87a', b'GIF89a'],
     }
 
+    # 첫 바이트 → (포맷, 시그니처 튜플) 분기 테이블 (MAGIC_BYTES에서 파생)
+    # - 포맷별 시그니처는 첫 바이트가 모두 같으므로 dict 조회 1회로 후보가 1개로 좁혀짐
+    # - bytes.startswith(tuple)로 후보 시그니처를 한 번에 비교
+    _FIRST_BYTE_SIG = {
+        signatures[0][0]: (img_format, tuple(signatures))
+        for img_format, signatures in MAGIC_BYTES.items()
+    }
+
+    # fused_validate()가 PIL의 img.format과 대조하는 허용 형식
+    ALLOWED_FORMATS = frozenset(MAGIC_BYTES) | {'webp'}
+
     # WebP는 고정 prefix가 아닌 구조체 형식이므로 별도 상수
     _WEBP_RIFF   = b'RIFF'   # bytes 0..3
     _WEBP_MARKER = b'WEBP'   # bytes 8..11
+
+    # JPEG SOF(Start Of Frame) 마커 — 프레임 헤더에 높이·너비가 기록됨
+    # (0xC4 DHT, 0xC8 JPG, 0xCC DAC는 SOF가 아님)
+    _JPEG_SOF_MARKERS = frozenset(
+        range(0xC0, 0xD0)
+    ) - {0xC4, 0xC8, 0xCC}
     
     def __init__(
         self,
@@ -48,7 +69,8 @@ class ImageValidator:
         min_height: int = 32,
         max_width: int = 4096,
         max_height: int = 4096,
-        max_aspect_ratio: float = 10.0
+        max_aspect_ratio: float = 10.0,
+        max_bytes: int = 10 * 1024 * 1024
     ):
         """
         Args:
@@ -57,14 +79,14 @@ class ImageValidator:
             max_width (int): 최대 이미지 너비
             max_height (int): 최대 이미지 높이
             max_aspect_ratio (float): 최대 가로세로 비율 (예: 10.0 = 10:1)
+            max_bytes (int): 최대 파일 크기 (바이트) — 헤더 파싱 전에 확인
         """
         self.min_width = min_width
         self.min_height = min_height
         self.max_width = max_width
         self.max_height = max_height
         self.max_aspect_ratio = max_aspect_ratio
-        
-        self.logger = logging.getLogger('aiclassifier.validation')
+        self.max_bytes = max_bytes
 
     # ─── WebP 전용 검증 ────────────────────────────────────────────
 
@@ -94,10 +116,13 @@ class ImageValidator:
     def validate_magic_bytes(self, image_bytes: bytes) -> Tuple[bool, Optional[str]]:
         """
         매직 바이트를 확인하여 실제 이미지 파일인지 검증
+
+        fused_validate()에서는 PIL 파싱 전 조기 거절과 _peek_dims() 형식
+        힌트로만 쓰이며, 최종 형식 판정은 PIL의 img.format이 담당합니다.
         
         검증 순서:
-          1. WebP 구조체 검증 (_is_webp — RIFF + WEBP 복합 체크)
-          2. MAGIC_BYTES prefix 매칭 (JPEG / PNG / GIF)
+          1. 첫 바이트로 _FIRST_BYTE_SIG 조회 → 해당 포맷 prefix 매칭 (JPEG / PNG / GIF)
+          2. WebP 구조체 검증 (_is_webp — RIFF + WEBP 복합 체크)
         
         Args:
             image_bytes (bytes): 이미지 바이트 데이터
@@ -106,35 +131,193 @@ class ImageValidator:
             tuple: (is_valid: bool, image_format: str or None)
         """
         if len(image_bytes) < 12:
-            self.logger.warning("파일이 너무 작습니다 (매직 바이트 확인 불가)")
+            logger.warning("파일이 너무 작습니다 (매직 바이트 확인 불가)")
             return False, None
 
-        # 1. WebP 구조체 검증 (RIFF 오감지 방지)
-        if self._is_webp(image_bytes):
-            self.logger.debug("이미지 형식 확인: WEBP")
+        # 1. prefix-only 포맷 매칭 (첫 바이트 분기)
+        entry = self._FIRST_BYTE_SIG.get(image_bytes[0])
+        if entry is not None:
+            img_format, signatures = entry
+            if image_bytes.startswith(signatures):
+                logger.debug("이미지 형식 확인: %s", img_format.upper())
+                return True, img_format
+
+        # 2. WebP 구조체 검증 (RIFF 오감지 방지)
+        elif self._is_webp(image_bytes):
+            logger.debug("이미지 형식 확인: WEBP")
             return True, 'webp'
-        
-        # 2. prefix-only 포맷 매칭
-        for img_format, signatures in self.MAGIC_BYTES.items():
-            for signature in signatures:
-                if image_bytes.startswith(signature):
-                    self.logger.debug(f"이미지 형식 확인: {img_format.upper()}")
-                    return True, img_format
-        
-        self.logger.warning("알 수 없는 파일 형식 (이미지가 아닐 수 있음)")
+
+        logger.warning("알 수 없는 파일 형식 (이미지가 아닐 수 있음)")
         return False, None
     
+    # ─── 헤더 기반 크기 추출 ───────────────────────────────────────
+
+    @classmethod
+    def _peek_dims(cls, image_bytes: bytes, img_format: Optional[str]) -> Optional[Tuple[int, int]]:
+        """
+        PIL 없이 파일 헤더에서 (width, height) 추출
+
+        포맷별 고정 오프셋(JPEG는 SOF 세그먼트)에서 크기만 읽습니다.
+        알 수 없는 포맷이거나 헤더가 예상과 다르면 None을 반환합니다.
+        조기 거절 용도일 뿐 파일 구조를 검증하지 않으므로, 통과한 파일도
+        반드시 PIL 헤더 파싱을 거쳐야 합니다.
+
+        Args:
+            image_bytes (bytes): 이미지 바이트 데이터
+            img_format (str or None): validate_magic_bytes()가 판별한 형식
+        """
+        try:
+            if img_format == 'png':
+                # 시그니처(8B) + IHDR 길이(4B) + 'IHDR'(4B) + width, height (BE uint32)
+                if image_bytes[12:16] != b'IHDR':
+                    return None
+                return struct.unpack_from('>II', image_bytes, 16)
+
+            if img_format == 'gif':
+                # 'GIF8?a'(6B) + 논리 화면 width, height (LE uint16)
+                return struct.unpack_from('<HH', image_bytes, 6)
+
+            if img_format == 'webp':
+                chunk = image_bytes[12:16]
+                if chunk == b'VP8 ':
+                    # 손실 압축: 키프레임 시작 코드 뒤 14-bit width, height
+                    width, height = struct.unpack_from('<HH', image_bytes, 26)
+                    return width & 0x3FFF, height & 0x3FFF
+                if chunk == b'VP8L':
+                    # 무손실: 시그니처(0x2F) 뒤 14-bit (width-1), (height-1) 비트 패킹
+                    bits = struct.unpack_from('<I', image_bytes, 21)[0]
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk == b'VP8X':
+                    # 확장: 24-bit (canvas_width-1), (canvas_height-1)
+                    width = int.from_bytes(image_bytes[24:27], 'little') + 1
+                    height = int.from_bytes(image_bytes[27:30], 'little') + 1
+                    return width, height
+                return None
+
+            if img_format == 'jpeg':
+                # SOI(FF D8) 이후 세그먼트를 길이 필드로 건너뛰며 SOF 탐색
+                # (EXIF 썸네일 내부의 SOF에 속지 않도록 단순 검색은 사용하지 않음)
+                pos, size = 2, len(image_bytes)
+                while pos + 4 <= size:
+                    if image_bytes[pos] != 0xFF:
+                        return None
+                    marker = image_bytes[pos + 1]
+                    if marker == 0xFF:          # 채움 바이트
+                        pos += 1
+                        continue
+                    if marker in cls._JPEG_SOF_MARKERS:
+                        # FF Cn | 길이(2B) | 정밀도(1B) | height(2B) | width(2B)
+                        height, width = struct.unpack_from('>HH', image_bytes, pos + 5)
+                        return width, height
+                    if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                        pos += 2                 # 길이 필드 없는 단독 마커
+                        continue
+                    pos += 2 + struct.unpack_from('>H', image_bytes, pos + 2)[0]
+                return None
+
+        except struct.error:
+            return None
+
+        return None
+
     # ─── 크기·비율 검증 ────────────────────────────────────────────
 
-    def validate_image_dimensions(self, image_bytes: bytes) -> Tuple[bool, Optional[str]]:
+    def _check_dims(self, width: int, height: int) -> Optional[str]:
         """
-        이미지 크기와 가로세로 비율 검증
-        
+        크기·비율 제한 확인 — 위반 시 오류 메시지, 통과 시 None
+
         검증 순서 (주의: 순서 변경 시 테스트도 함께 수정 필요)
           1. 최소 크기
           2. 최대 크기
           3. 가로세로 비율
+        """
+        # 최소 크기 확인
+        if width < self.min_width or height < self.min_height:
+            return (
+                f"이미지가 너무 작습니다 ({width}x{height}). "
+                f"최소 {self.min_width}x{self.min_height} 필요"
+            )
+        
+        # 최대 크기 확인
+        if width > self.max_width or height > self.max_height:
+            return (
+                f"이미지가 너무 큽니다 ({width}x{height}). "
+                f"최대 {self.max_width}x{self.max_height} 허용"
+            )
+        
+        # 가로세로 비율 확인 — 긴 변 > 비율 × 짧은 변 (정상 경로에서 나눗셈 없음)
+        lo, hi = (width, height) if width < height else (height, width)
+        if lo == 0 or hi > self.max_aspect_ratio * lo:
+            aspect_ratio = hi / lo if lo else float('inf')
+            return (
+                f"가로세로 비율이 비정상적입니다 ({aspect_ratio:.1f}:1). "
+                f"최대 {self.max_aspect_ratio}:1 허용"
+            )
+        
+        return None
+
+    def fused_validate(self, image_bytes: bytes) -> str:
+        """
+        단일 패스 이미지 검증 — PIL 이미지 객체는 한 번만 생성
+
+        1. 파일 크기 확인 (max_bytes)
+        2. 첫 바이트 매직 확인 → _peek_dims()로 헤더 크기를 읽어 제한 위반
+           파일을 PIL 파싱 전에 조기 거절
+        3. Image.open 1회 — img.format을 허용 목록과 대조하고, img.size로
+           크기·비율을 검증합니다 (load() 호출 없음 → 픽셀 디코딩 없음).
+           잘린 파일·스캔 데이터 없는 JPEG 등 손상된 파일은 여기서 거절됩니다.
+
+        Args:
+            image_bytes (bytes): 이미지 바이트 데이터
+
+        Returns:
+            str: PIL이 판별한 이미지 형식 (소문자)
+
+        Raises:
+            InvalidImageError: 검증 실패 시
+        """
+        # 1. 파일 크기 확인 — PIL 파싱이 대용량 메타데이터를 읽기 전에 거절
+        if len(image_bytes) > self.max_bytes:
+            raise InvalidImageError(
+                f"이미지 파일이 너무 큽니다 ({len(image_bytes)} bytes). "
+                f"최대 {self.max_bytes} bytes 허용"
+            )
+
+        # 2. 매직 바이트 + 헤더 peek 기반 조기 거절
+        is_valid, img_format = self.validate_magic_bytes(image_bytes)
+        if not is_valid:
+            raise InvalidImageError("유효한 이미지 형식이 아닙니다")
+
+        dims = self._peek_dims(image_bytes, img_format)
+        if dims is not None:
+            error_msg = self._check_dims(*dims)
+            if error_msg is not None:
+                raise InvalidImageError(error_msg)
 
+        # 3. PIL 헤더 파싱 1회 — 형식·크기를 같은 객체에서 읽고 즉시 닫음
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                pil_format = (img.format or '').lower()
+                width, height = img.size
+        except (Image.UnidentifiedImageError, Image.DecompressionBombError,
+                SyntaxError, OSError) as e:
+            logger.debug("PIL 헤더 파싱 실패: %s", e)
+            raise InvalidImageError("이미지 파일이 손상되었거나 읽을 수 없습니다")
+
+        if pil_format not in self.ALLOWED_FORMATS:
+            raise InvalidImageError("유효한 이미지 형식이 아닙니다")
+
+        error_msg = self._check_dims(width, height)
+        if error_msg is not None:
+            raise InvalidImageError(error_msg)
+
+        logger.debug("이미지 크기 검증 통과: %dx%d", width, height)
+        return pil_format
+
+    def validate_image_dimensions(self, image_bytes: bytes) -> Tuple[bool, Optional[str]]:
+        """
+        이미지 크기와 가로세로 비율 검증 (레거시 — fused_validate() 래퍼)
+        
         Args:
             image_bytes (bytes): 이미지 바이트 데이터
         
@@ -142,53 +325,17 @@ class ImageValidator:
             tuple: (is_valid: bool, error_message: str or None)
         """
         try:
-            img = Image.open(io.BytesIO(image_bytes))
-            width, height = img.size
-            
-            # 최소 크기 확인
-            if width < self.min_width or height < self.min_height:
-                error_msg = (
-                    f"이미지가 너무 작습니다 ({width}x{height}). "
-                    f"최소 {self.min_width}x{self.min_height} 필요"
-                )
-                self.logger.warning(error_msg)
-                return False, error_msg
-            
-            # 최대 크기 확인
-            if width > self.max_width or height > self.max_height:
-                error_msg = (
-                    f"이미지가 너무 큽니다 ({width}x{height}). "
-                    f"최대 {self.max_width}x{self.max_height} 허용"
-                )
-                self.logger.warning(error_msg)
-                return False, error_msg
-            
-            # 가로세로 비율 확인
-            aspect_ratio = max(width / height, height / width)
-            if aspect_ratio > self.max_aspect_ratio:
-                error_msg = (
-                    f"가로세로 비율이 비정상적입니다 ({aspect_ratio:.1f}:1). "
-                    f"최대 {self.max_aspect_ratio}:1 허용"
-                )
-                self.logger.warning(error_msg)
-                return False, error_msg
-            
-            self.logger.debug(
-                f"이미지 크기 검증 통과: {width}x{height} "
-                f"(비율: {aspect_ratio:.2f}:1)"
-            )
-            return True, None
-            
-        except Exception as e:
-            error_msg = f"이미지 크기 확인 실패: {str(e)}"
-            self.logger.error(error_msg)
-            return False, error_msg
+            self.fused_validate(image_bytes)
+        except InvalidImageError as e:
+            logger.warning(e.message)
+            return False, e.message
+        return True, None
     
     # ─── 종합 검증 ─────────────────────────────────────────────────
 
     def comprehensive_validation(self, image_bytes: bytes) -> Tuple[bool, Optional[str]]:
         """
-        종합 이미지 검증 (매직 바이트 + 크기)
+        종합 이미지 검증 (매직 바이트 + 크기) — fused_validate()에 위임
         
         Args:
             image_bytes (bytes): 이미지 바이트 데이터
@@ -199,18 +346,8 @@ class ImageValidator:
         Raises:
             InvalidImageError: 검증 실패 시
         """
-        # 1. 매직 바이트 검증
-        is_valid, img_format = self.validate_magic_bytes(image_bytes)
-        if not is_valid:
-            error_msg = "유효한 이미지 형식이 아닙니다"
-            raise InvalidImageError(error_msg)
-        
-        # 2. 이미지 크기 검증
-        is_valid, error_msg = self.validate_image_dimensions(image_bytes)
-        if not is_valid:
-            raise InvalidImageError(error_msg)
-        
-        self.logger.info(f"이미지 검증 완료 (형식: {img_format.upper()})")
+        img_format = self.fused_validate(image_bytes)
+        logger.info("이미지 검증 완료 (형식: %s)", img_format.upper())
         return True, None
 
 
@@ -224,7 +361,8 @@ def init_image_validator(
     min_height: int = 32,
     max_width: int = 4096,
     max_height: int = 4096,
-    max_aspect_ratio: float = 10.0
+    max_aspect_ratio: float = 10.0,
+    max_bytes: int = 10 * 1024 * 1024
 ) -> ImageValidator:
     """
     글로벌 이미지 검증기 초기화
@@ -235,6 +373,7 @@ def init_image_validator(
         max_width (int): 최대 이미지 너비
         max_height (int): 최대 이미지 높이
         max_aspect_ratio (float): 최대 가로세로 비율
+        max_bytes (int): 최대 파일 크기 (바이트)
     
     Returns:
         ImageValidator: 초기화된 검증기 인스턴스
@@ -245,7 +384,8 @@ def init_image_validator(
         min_height=min_height,
         max_width=max_width,
         max_height=max_height,
-        max_aspect_ratio=max_aspect_ratio
+        max_aspect_ratio=max_aspect_ratio,
+        max_bytes=max_bytes
     )
     return _global_validator
 
@@ -10,10 +10,20 @@ class AIClassifierException(Exception):
     기본 애플리케이션 예외 클래스
     
     모든 커스텀 예외의 부모 클래스입니다.
+    기본 error_code는 클래스 속성으로 정의하며, 지정하지 않은 하위 클래스는
+    클래스 생성 시 클래스 이름이 기본값으로 설정됩니다.
     """
+    error_code = "AIClassifierException"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'error_code' not in cls.__dict__:
+            cls.error_code = cls.__name__
+
     def __init__(self, message: str, error_code: str = None):
         self.message = message
-        self.error_code = error_code or self.__class__.__name__
+        if error_code is not None:
+            self.error_code = error_code
         super().__init__(self.message)
 
 
@@ -24,8 +34,10 @@ class ModelNotLoadedError(AIClassifierException):
     Example:
         raise ModelNotLoadedError("ONNX 모델 파일을 찾을 수 없습니다")
     """
+    error_code = "MODEL_NOT_LOADED"
+
     def __init__(self, message: str = "모델이 로드되지 않았습니다"):
-        super().__init__(message, error_code="MODEL_NOT_LOADED")
+        super().__init__(message)
 
 
 class ModelLoadError(AIClassifierException):
@@ -35,8 +47,10 @@ class ModelLoadError(AIClassifierException):
     Example:
         raise ModelLoadError("손상된 ONNX 파일입니다")
     """
+    error_code = "MODEL_LOAD_ERROR"
+
     def __init__(self, message: str, original_error: Exception = None):
-        super().__init__(message, error_code="MODEL_LOAD_ERROR")
+        super().__init__(message)
         self.original_error = original_error
 
 
@@ -47,8 +61,10 @@ class InvalidImageError(AIClassifierException):
     Example:
         raise InvalidImageError("지원하지 않는 이미지 형식입니다")
     """
+    error_code = "INVALID_IMAGE"
+
     def __init__(self, message: str):
-        super().__init__(message, error_code="INVALID_IMAGE")
+        super().__init__(message)
 
 
 class ImageProcessingError(AIClassifierException):
@@ -58,8 +74,10 @@ class ImageProcessingError(AIClassifierException):
     Example:
         raise ImageProcessingError("이미지 리사이징 중 오류가 발생했습니다")
     """
+    error_code = "IMAGE_PROCESSING_ERROR"
+
     def __init__(self, message: str, original_error: Exception = None):
-        super().__init__(message, error_code="IMAGE_PROCESSING_ERROR")
+        super().__init__(message)
         self.original_error = original_error
 
 
@@ -70,8 +88,10 @@ class PredictionError(AIClassifierException):
     Example:
         raise PredictionError("ONNX 런타임 오류가 발생했습니다")
     """
+    error_code = "PREDICTION_ERROR"
+
     def __init__(self, message: str, original_error: Exception = None):
-        super().__init__(message, error_code="PREDICTION_ERROR")
+        super().__init__(message)
         self.original_error = original_error
 
 
@@ -82,8 +102,10 @@ class FileValidationError(AIClassifierException):
     Example:
         raise FileValidationError("파일 크기가 10MB를 초과합니다")
     """
+    error_code = "FILE_VALIDATION_ERROR"
+
     def __init__(self, message: str):
-        super().__init__(message, error_code="FILE_VALIDATION_ERROR")
+        super().__init__(message)
 
 
 class ConfigurationError(AIClassifierException):
@@ -93,5 +115,7 @@ class ConfigurationError(AIClassifierException):
     Example:
         raise ConfigurationError("필수 환경변수가 설정되지 않았습니다")
     """
+    error_code = "CONFIGURATION_ERROR"
+
     def __init__(self, message: str):
-        super().__init__(message, error_code="CONFIGURATION_ERROR")
+        super().__init__(message)
@@ -5,15 +5,85 @@
 """
 
 import psutil
+import threading
 import time
-from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 
 from .logger import get_logger
 
 
 logger = get_logger('aiclassifier.health')
 
+# 시스템 리소스 점검 결과 재사용 기간 (초)
+# - 짧게 유지해 모니터링 값이 실시간에 가깝도록 함
+SYSTEM_RESOURCES_TTL = 5.0
+
+
+class CpuSampler:
+    """
+    독립 CPU 사용률 샘플러
+
+    psutil.cpu_percent(interval=None)는 모듈 전역 기준점 하나를 공유하므로
+    여러 호출자가 서로의 측정 구간을 리셋합니다. 각 호출자가 자신의
+    인스턴스를 갖고 psutil.cpu_times() 스냅샷 차분으로 사용률을 계산합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = self._snapshot()
+        self._last_percent = 0.0
+
+    @staticmethod
+    def _snapshot() -> tuple:
+        """(busy, total) CPU 시간 — psutil.cpu_percent와 같은 방식으로 집계"""
+        times = psutil.cpu_times()
+        total = sum(times)
+        # Linux의 guest 시간은 user/nice에 이미 포함되어 있음
+        total -= getattr(times, 'guest', 0.0) + getattr(times, 'guest_nice', 0.0)
+        idle = times.idle + getattr(times, 'iowait', 0.0)
+        return total - idle, total
+
+    def sample(self) -> float:
+        """직전 sample() 이후 구간의 CPU 사용률 (%, 비차단)"""
+        busy, total = self._snapshot()
+        with self._lock:
+            last_busy, last_total = self._last
+            delta = total - last_total
+            if delta <= 0:
+                # 구간이 너무 짧으면 기준점을 유지하고 직전 값 반환
+                return self._last_percent
+            self._last = (busy, total)
+            self._last_percent = min(max((busy - last_busy) / delta * 100.0, 0.0), 100.0)
+            return self._last_percent
+
+
+def _collect_dependency_versions() -> Dict[str, Any]:
+    """주요 의존성 버전 수집 (프로세스 수명 동안 변하지 않으므로 모듈 로드 시 1회)"""
+    try:
+        import flask
+        import numpy
+        import PIL
+        import onnxruntime
+        
+        return {
+            'status': 'healthy',
+            'packages': {
+                'flask': flask.__version__,
+                'numpy': numpy.__version__,
+                'pillow': PIL.__version__,
+                'onnxruntime': onnxruntime.__version__
+            }
+        }
+    except Exception as e:
+        logger.error(f"의존성 확인 실패: {e}")
+        return {
+            'status': 'error',
+            'error': str(e)
+        }
+
+
+_DEPENDENCIES = _collect_dependency_versions()
+
 
 class HealthChecker:
     """
@@ -30,17 +100,51 @@ class HealthChecker:
             app: Flask 애플리케이션 인스턴스
         """
         self.app = app
-        self.start_time = time.time()
-    
+        self.start_time = time.time()            # 표시용 벽시계 시각
+        self._start_monotonic = time.monotonic() # 가동 시간 계산용
+
+        # 전용 CPU 샘플러 — /metrics 수집과 측정 구간을 공유하지 않음
+        self._cpu_sampler = CpuSampler()
+
+        # 점검 결과 TTL 캐시: {키: (결과, 만료 시각(monotonic))}
+        self._check_cache: Dict[str, tuple] = {}
+        self._check_cache_lock = threading.Lock()
+
+    def _cached_check(self, key: str, ttl: float, check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        점검 결과를 ttl초 동안 재사용
+
+        정상(status == 'healthy') 결과만 저장하므로 오류 상태는
+        다음 요청에서 즉시 다시 점검됩니다.
+        """
+        now = time.monotonic()
+        with self._check_cache_lock:
+            entry = self._check_cache.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        result = check()
+        if result.get('status') == 'healthy':
+            with self._check_cache_lock:
+                self._check_cache[key] = (result, now + ttl)
+        return result
+
     def check_system_resources(self) -> Dict[str, Any]:
         """
-        시스템 리소스 상태 확인
+        시스템 리소스 상태 확인 (SYSTEM_RESOURCES_TTL 동안 재사용)
         
         Returns:
             Dict: 시스템 리소스 정보
         """
+        return self._cached_check(
+            'system', SYSTEM_RESOURCES_TTL, self._check_system_resources
+        )
+
+    def _check_system_resources(self) -> Dict[str, Any]:
+        """시스템 리소스 측정 (캐시 없음)"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # 비차단 측정 (interval=0.1은 요청마다 100ms 대기)
+            cpu_percent = self._cpu_sampler.sample()
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
@@ -82,20 +186,13 @@ class HealthChecker:
         """
         try:
             if predictor and predictor.is_ready():
-                model_info = predictor.get_model_info()
-                
-                # 모델 파일 크기 확인
-                model_path = Path(predictor.model_path)
-                model_size_mb = 0
-                if model_path.exists():
-                    model_size_mb = round(model_path.stat().st_size / (1024 * 1024), 2)
-                
                 return {
                     'status': 'ready',
                     'model_path': predictor.model_path,
                     'labels_path': predictor.labels_path,
                     'num_classes': len(predictor.class_names),
-                    'model_size_mb': model_size_mb
+                    # 로드 시 기록된 값 사용 (요청마다 stat() 호출 없음)
+                    'model_size_mb': getattr(predictor, 'model_size_mb', 0)
                 }
             else:
                 return {
@@ -111,32 +208,12 @@ class HealthChecker:
     
     def check_dependencies(self) -> Dict[str, Any]:
         """
-        주요 의존성 패키지 상태 확인
+        주요 의존성 패키지 상태 확인 (모듈 로드 시 1회 수집한 결과)
         
         Returns:
             Dict: 의존성 상태 정보
         """
-        try:
-            import flask
-            import numpy
-            import PIL
-            import onnxruntime
-            
-            return {
-                'status': 'healthy',
-                'packages': {
-                    'flask': flask.__version__,
-                    'numpy': numpy.__version__,
-                    'pillow': PIL.__version__,
-                    'onnxruntime': onnxruntime.__version__
-                }
-            }
-        except Exception as e:
-            logger.error(f"의존성 확인 실패: {e}")
-            return {
-                'status': 'error',
-                'error': str(e)
-            }
+        return _DEPENDENCIES
     
     def get_uptime(self) -> Dict[str, Any]:
         """
@@ -145,7 +222,7 @@ class HealthChecker:
         Returns:
             Dict: 가동 시간 정보
         """
-        uptime_seconds = time.time() - self.start_time
+        uptime_seconds = time.monotonic() - self._start_monotonic
         
         days = int(uptime_seconds // 86400)
         hours = int((uptime_seconds % 86400) // 3600)
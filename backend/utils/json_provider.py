@@ -0,0 +1,62 @@
+"""
+JSON 직렬화 프로바이더 모듈
+
+Flask 기본 json(순수 Python) 대신 orjson을 사용하는 JSONProvider를 제공합니다.
+orjson이 설치되지 않은 환경에서는 Flask 기본 프로바이더가 그대로 사용됩니다.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    orjson 기반 JSONProvider
+
+    - NumPy 배열/스칼라(float32 포함)를 변환 없이 직렬화
+    - 비ASCII 문자(한글 메시지)를 이스케이프 없이 UTF-8로 출력
+    - response()는 str 디코딩 없이 bytes를 그대로 응답 본문으로 사용
+
+    Usage:
+        app.json = OrjsonProvider(app)
+    """
+
+    _OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if ORJSON_AVAILABLE else 0
+    )
+
+    def _dumps_bytes(self, obj: Any, sort_keys: bool, indent: Any = None, default=None) -> bytes:
+        # DefaultJSONProvider와 같은 출력 계약 유지 (sort_keys 기본값 True)
+        # orjson은 들여쓰기 폭을 지원하지 않으므로 indent 지정 시 2칸 고정
+        option = self._OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default or self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._dumps_bytes(
+            obj,
+            sort_keys=kwargs.get('sort_keys', self.sort_keys),
+            indent=kwargs.get('indent'),
+            default=kwargs.get('default'),
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        # DefaultJSONProvider.response와 동일: compact=None이면 디버그 모드에서만 들여쓰기
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = self._dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -5,11 +5,32 @@
 파일 로그, 콘솔 로그, 로그 로테이션 기능을 지원합니다.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+
+# 로거 이름 → 파일 기록용 백그라운드 리스너
+_queue_listeners: Dict[str, QueueListener] = {}
+
+
+def _stop_queue_listener(name: str) -> None:
+    """실행 중인 리스너를 중지 (대기 중인 레코드를 모두 기록한 뒤 종료)"""
+    listener = _queue_listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_all_queue_listeners() -> None:
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
 
 
 def setup_logger(
@@ -22,6 +43,9 @@ def setup_logger(
 ) -> logging.Logger:
     """
     구조화된 로거 설정
+
+    파일 로그는 QueueHandler → QueueListener(백그라운드 스레드)로 기록하여
+    요청 스레드가 디스크 I/O·로그 로테이션에 막히지 않도록 합니다.
     
     Args:
         name (str): 로거 이름
@@ -38,7 +62,8 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # 기존 핸들러 제거 (중복 방지)
+    # 기존 핸들러·리스너 제거 (중복 방지)
+    _stop_queue_listener(name)
     if logger.hasHandlers():
         logger.handlers.clear()
     
@@ -73,7 +98,6 @@ def setup_logger(
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
         
         # 에러 로그 파일 (ERROR 레벨 이상만)
         error_file_handler = RotatingFileHandler(
@@ -84,7 +108,16 @@ def setup_logger(
         )
         error_file_handler.setLevel(logging.ERROR)
         error_file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(error_file_handler)
+
+        # 요청 스레드는 큐에 레코드만 넣고, 파일 기록은 리스너 스레드가 담당
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(
+            log_queue, file_handler, error_file_handler,
+            respect_handler_level=True
+        )
+        listener.start()
+        _queue_listeners[name] = listener
+        logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
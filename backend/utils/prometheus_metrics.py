@@ -6,22 +6,25 @@ Grafana 대시보드와 네이티브 통합되며, production 환경의
 성능 분석 및 장애 대응을 지원합니다.
 """
 
+import os
+import threading
 import time
 import psutil
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from functools import wraps
 
 from prometheus_client import (
     Counter,
     Gauge,
     Histogram,
-    Summary,
     Info,
     CollectorRegistry,
     generate_latest,
     CONTENT_TYPE_LATEST
 )
 
+from .health import CpuSampler
+
 
 # ─── 글로벌 레지스트리 ─────────────────────────────────────────────
 # 
@@ -30,6 +33,39 @@ from prometheus_client import (
 #
 REGISTRY = CollectorRegistry(auto_describe=True)
 
+# 요청 경로(WSGI 미들웨어·데코레이터)에서 쓰는 단조 시계 — 모듈 속성 조회 생략
+_perf_counter_ns = time.perf_counter_ns
+
+
+def _buckets_from_env(name: str, default: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    환경변수(쉼표 구분 초 단위)에서 히스토그램 버킷 읽기
+
+    값이 없거나 파싱에 실패하면 default를 사용합니다. +Inf 버킷은 자동으로 추가됩니다.
+    예: PROM_HTTP_BUCKETS="0.05,0.1,0.5,1,5"
+    """
+    raw = os.environ.get(name)
+    if not raw:
+        return default
+    try:
+        buckets = tuple(sorted(float(v) for v in raw.split(',') if v.strip()))
+    except ValueError:
+        return default
+    if not buckets:
+        return default
+    if buckets[-1] != float('inf'):
+        buckets += (float('inf'),)
+    return buckets
+
+
+# 히스토그램 버킷 — 버킷 수에 비례해 export 크기·Prometheus 메모리가 늘어나므로 SLO 구간 위주로 최소화
+HTTP_DURATION_BUCKETS = _buckets_from_env(
+    'PROM_HTTP_BUCKETS', (0.05, 0.1, 0.25, 0.5, 1.0, 5.0, float('inf'))
+)
+INFERENCE_DURATION_BUCKETS = _buckets_from_env(
+    'PROM_INFERENCE_BUCKETS', (0.01, 0.05, 0.1, 0.25, 1.0, float('inf'))
+)
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  메트릭 정의
@@ -46,28 +82,34 @@ http_requests_total = Counter(
 )
 
 # 요청 처리 시간 히스토그램 (P50/P95/P99 분석용)
-# 버킷: 10ms, 50ms, 100ms, 500ms, 1s, 5s, 10s, 30s, +Inf
+# 기본 버킷: 50ms, 100ms, 250ms, 500ms, 1s, 5s, +Inf (PROM_HTTP_BUCKETS로 변경)
 http_request_duration_seconds = Histogram(
     'http_request_duration_seconds',
     'HTTP request latency in seconds',
     ['endpoint', 'method'],
-    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, float('inf')),
+    buckets=HTTP_DURATION_BUCKETS,
     registry=REGISTRY
 )
 
+# 요청·응답 크기 버킷: 1KB ~ 4MB, +Inf
+# - Summary(sum/count만 제공)와 달리 인스턴스 간 집계와 분포 확인이 가능
+_SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, float('inf'))
+
 # 요청 크기 (바이트)
-http_request_size_bytes = Summary(
+http_request_size_bytes = Histogram(
     'http_request_size_bytes',
     'HTTP request size in bytes',
     ['endpoint', 'method'],
+    buckets=_SIZE_BUCKETS,
     registry=REGISTRY
 )
 
 # 응답 크기 (바이트)
-http_response_size_bytes = Summary(
+http_response_size_bytes = Histogram(
     'http_response_size_bytes',
     'HTTP response size in bytes',
     ['endpoint', 'method'],
+    buckets=_SIZE_BUCKETS,
     registry=REGISTRY
 )
 
@@ -81,12 +123,18 @@ predictions_total = Counter(
     registry=REGISTRY
 )
 
+# 상태별 child 메트릭 (상태 값이 고정이므로 임포트 시 1회 조회)
+_predictions_cache_hit = predictions_total.labels(status='cache_hit')
+_predictions_success = predictions_total.labels(status='success')
+_predictions_error = predictions_total.labels(status='error')
+
 # 추론 시간 히스토그램 (모델 실행 시간만 측정)
-# 버킷: 50ms, 100ms, 200ms, 500ms, 1s, 2s, 5s
+# 기본 버킷: 10ms, 50ms, 100ms, 250ms, 1s, +Inf (PROM_INFERENCE_BUCKETS로 변경)
+# - MobileNetV3-Small ONNX 추론은 CPU에서 수 ms~수십 ms 구간
 inference_duration_seconds = Histogram(
     'inference_duration_seconds',
     'Model inference time in seconds',
-    buckets=(0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, float('inf')),
+    buckets=INFERENCE_DURATION_BUCKETS,
     registry=REGISTRY
 )
 
@@ -204,16 +252,45 @@ app_info = Info(
 #  헬퍼 함수
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def update_system_metrics():
+# 시스템 메트릭 갱신 주기 (초) — 짧은 간격의 스크레이프는 직전 값을 그대로 export
+SYSTEM_METRICS_TTL = 5.0
+
+_last_system_update: Optional[float] = None
+_process: Optional[psutil.Process] = None
+
+# 전용 CPU 샘플러 — 헬스체크와 측정 구간을 공유하지 않음
+_cpu_sampler = CpuSampler()
+
+
+def _current_process() -> psutil.Process:
+    """현재 프로세스 핸들 (fork된 워커에서는 자신의 pid로 재생성)"""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process
+
+
+def update_system_metrics(force: bool = False):
     """
     시스템 리소스 메트릭 업데이트
     
     주기적으로 호출하여 CPU/메모리 사용률을 갱신합니다.
-    /metrics 엔드포인트 호출 시 자동 실행됩니다.
+    /metrics 엔드포인트 호출 시 자동 실행되며,
+    SYSTEM_METRICS_TTL 이내의 재호출은 psutil 조회 없이 반환합니다.
+
+    Args:
+        force: True면 TTL과 무관하게 즉시 갱신
     """
+    global _last_system_update
+    now = time.monotonic()
+    if not force and _last_system_update is not None \
+            and now - _last_system_update < SYSTEM_METRICS_TTL:
+        return
+    _last_system_update = now
+
     try:
-        # CPU
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        # CPU (비차단 — interval=0.1은 스크레이프마다 100ms 대기)
+        cpu_percent = _cpu_sampler.sample()
         system_cpu_percent.set(cpu_percent)
         
         # 시스템 메모리
@@ -224,8 +301,7 @@ def update_system_metrics():
         system_memory_bytes.labels(type='total').set(mem.total)
         
         # 프로세스 메모리
-        process = psutil.Process()
-        mem_info = process.memory_info()
+        mem_info = _current_process().memory_info()
         process_memory_bytes.labels(type='rss').set(mem_info.rss)
         process_memory_bytes.labels(type='vms').set(mem_info.vms)
         
@@ -250,19 +326,21 @@ def track_request_time(endpoint: str, method: str) -> Callable:
         def predict():
             ...
     """
+    # 레이블 조합이 고정이므로 child 메트릭을 데코레이터 생성 시 1회만 조회
+    histogram = http_request_duration_seconds.labels(
+        endpoint=endpoint,
+        method=method
+    )
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = _perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
-                http_request_duration_seconds.labels(
-                    endpoint=endpoint,
-                    method=method
-                ).observe(duration)
+                histogram.observe((_perf_counter_ns() - start_ns) / 1e9)
         return wrapper
     return decorator
 
@@ -295,10 +373,10 @@ def record_prediction(
         )
     """
     if cache_hit:
-        predictions_total.labels(status='cache_hit').inc()
+        _predictions_cache_hit.inc()
         cache_hits_total.inc()
     elif success:
-        predictions_total.labels(status='success').inc()
+        _predictions_success.inc()
         cache_misses_total.inc()
         
         if inference_time is not None:
@@ -307,7 +385,7 @@ def record_prediction(
         if preprocessing_time is not None:
             preprocessing_duration_seconds.observe(preprocessing_time)
     else:
-        predictions_total.labels(status='error').inc()
+        _predictions_error.inc()
 
 
 def update_cache_metrics(
@@ -347,6 +425,17 @@ def update_cache_metrics(
         cache_memory_bytes.set(memory_bytes)
 
 
+# 모델 상태 → model_state 게이지 값
+_MODEL_STATE_VALUES = {
+    'not_loaded': 0,
+    'loaded': 1,
+    'error': 2
+}
+
+# 마지막으로 설정한 app_info 값 (동일 값 재설정 시 Info 검증·갱신 생략)
+_last_app_info: Optional[dict] = None
+
+
 def set_model_state(state: str, load_time: Optional[float] = None):
     """
     모델 상태 메트릭 설정
@@ -359,12 +448,7 @@ def set_model_state(state: str, load_time: Optional[float] = None):
         set_model_state('loaded', load_time=2.341)
         set_model_state('error')
     """
-    state_map = {
-        'not_loaded': 0,
-        'loaded': 1,
-        'error': 2
-    }
-    model_state.set(state_map.get(state, 0))
+    model_state.set(_MODEL_STATE_VALUES.get(state, 0))
     
     if load_time is not None:
         model_load_duration_seconds.set(load_time)
@@ -386,12 +470,23 @@ def set_app_info(version: str, environment: str, **kwargs):
             python_version='3.10.12'
         )
     """
+    global _last_app_info
     info_dict = {
         'version': version,
         'environment': environment,
         **kwargs
     }
+    if info_dict == _last_app_info:
+        return
     app_info.info(info_dict)
+    _last_app_info = info_dict
+
+
+# export 결과 재사용 기간 (초) — 0이면 스크레이프마다 직렬화
+METRICS_EXPOSITION_TTL = float(os.environ.get('PROM_EXPOSITION_TTL', '1.0'))
+
+_exposition_cache: Optional[Tuple[bytes, float]] = None   # (본문, 만료 시각(monotonic))
+_exposition_lock = threading.Lock()
 
 
 def get_metrics() -> tuple[bytes, str]:
@@ -399,6 +494,8 @@ def get_metrics() -> tuple[bytes, str]:
     Prometheus 형식 메트릭 export
     
     /metrics 엔드포인트에서 호출됩니다.
+    직렬화 결과를 METRICS_EXPOSITION_TTL 동안 재사용하며, 동시에 들어온
+    스크레이프는 한 번의 직렬화 결과를 공유합니다.
     
     Returns:
         tuple: (메트릭 바이트, content-type)
@@ -407,17 +504,59 @@ def get_metrics() -> tuple[bytes, str]:
         metrics_output, content_type = get_metrics()
         return Response(metrics_output, mimetype=content_type)
     """
-    # 시스템 메트릭 갱신
-    update_system_metrics()
-    
-    # Prometheus 형식으로 export
-    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    global _exposition_cache
+    with _exposition_lock:
+        now = time.monotonic()
+        if _exposition_cache is not None and _exposition_cache[1] > now:
+            return _exposition_cache[0], CONTENT_TYPE_LATEST
+
+        # 시스템 메트릭 갱신
+        update_system_metrics()
+        
+        # Prometheus 형식으로 export
+        output = generate_latest(REGISTRY)
+        _exposition_cache = (output, now + METRICS_EXPOSITION_TTL)
+    return output, CONTENT_TYPE_LATEST
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  Middleware 통합
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# endpoint 레이블로 그대로 쓸 경로 — 그 외 경로는 묶어서 기록해 시계열 수를 고정
+# (원본 PATH_INFO를 쓰면 임의 경로 요청마다 새 시계열이 생겨 메모리가 무한 증가)
+_KNOWN_ENDPOINTS = frozenset({
+    '/', '/predict', '/metrics',
+    '/health', '/health/detailed', '/health/ready', '/health/live',
+    '/model/info', '/model/stats', '/model/cache',
+})
+
+
+# method 레이블로 그대로 쓸 HTTP 메서드 — 그 외 메서드(클라이언트 임의 값 포함)는 'OTHER'
+_KNOWN_METHODS = frozenset({'GET', 'POST', 'OPTIONS', 'HEAD', 'DELETE'})
+
+
+# 메트릭을 기록하지 않는 경로
+# - /metrics: 스크레이프 자체가 다음 스크레이프의 직렬화 대상을 늘리지 않도록
+# - /health/live: 주기적 liveness 프로브 (요청 지표로서 의미 없음)
+# /health/ready는 프론트엔드 웜업 확인에도 쓰이므로 기록 대상에 남겨 둡니다.
+_UNTRACKED_PATHS = frozenset({'/metrics', '/health/live'})
+
+
+def _normalize_endpoint(path: str) -> str:
+    """PATH_INFO → endpoint 레이블 (알려진 경로 외에는 '/static' 또는 '/other')"""
+    if path in _KNOWN_ENDPOINTS:
+        return path
+    if path.startswith('/static/'):
+        return '/static'
+    return '/other'
+
+
+def _normalize_method(method: str) -> str:
+    """REQUEST_METHOD → method 레이블 (알려진 메서드 외에는 'OTHER')"""
+    return method if method in _KNOWN_METHODS else 'OTHER'
+
+
 class PrometheusMiddleware:
     """
     Flask 미들웨어: 자동 메트릭 수집
@@ -431,14 +570,21 @@ class PrometheusMiddleware:
     
     def __init__(self, app):
         self.app = app
+        # 레이블 조합 → child 메트릭 캐시 (labels()의 락·해시 조회를 요청마다 반복하지 않음)
+        self._request_counters = {}
+        self._duration_histograms = {}
     
     def __call__(self, environ, start_response):
-        # 요청 시작 시간
-        start_time = time.time()
+        raw_path = environ.get('PATH_INFO', '/')
+        if raw_path in _UNTRACKED_PATHS:
+            return self.app(environ, start_response)
+
+        # 요청 시작 시간 (단조 시계 — 시스템 시각 조정의 영향 없음)
+        start_ns = _perf_counter_ns()
         
         # 요청 정보 추출
-        path = environ.get('PATH_INFO', '/')
-        method = environ.get('REQUEST_METHOD', 'GET')
+        path = _normalize_endpoint(raw_path)
+        method = _normalize_method(environ.get('REQUEST_METHOD', 'GET'))
         
         # 응답 캡처용 래퍼
         status_code = [None]
@@ -454,15 +600,24 @@ class PrometheusMiddleware:
             return response
         finally:
             # 메트릭 기록
-            duration = time.time() - start_time
+            duration = (_perf_counter_ns() - start_ns) / 1e9
+            status = status_code[0] or '500'
             
-            http_requests_total.labels(
-                endpoint=path,
-                method=method,
-                status=status_code[0] or '500'
-            ).inc()
+            counter = self._request_counters.get((path, method, status))
+            if counter is None:
+                counter = http_requests_total.labels(
+                    endpoint=path,
+                    method=method,
+                    status=status
+                )
+                self._request_counters[(path, method, status)] = counter
+            counter.inc()
             
-            http_request_duration_seconds.labels(
-                endpoint=path,
-                method=method
-            ).observe(duration)
+            histogram = self._duration_histograms.get((path, method))
+            if histogram is None:
+                histogram = http_request_duration_seconds.labels(
+                    endpoint=path,
+                    method=method
+                )
+                self._duration_histograms[(path, method)] = histogram
+            histogram.observe(duration)
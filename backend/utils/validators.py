@@ -13,6 +13,17 @@ from .exceptions import FileValidationError
 
 logger = logging.getLogger(__name__)
 
+# 허용 MIME 타입 (요청마다 집합을 새로 만들지 않도록 모듈 상수로 유지)
+_ALLOWED_MIME_TYPES = frozenset({
+    'image/jpeg',
+    'image/png',
+    'image/jpg'
+})
+
+# 매직 넘버
+_JPEG_SOI = b'\xff\xd8\xff'                 # FF D8 FF
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'       # 89 50 4E 47 0D 0A 1A 0A
+
 
 def allowed_file(filename: str, allowed_extensions: Set[str]) -> bool:
     """
@@ -25,11 +36,12 @@ def allowed_file(filename: str, allowed_extensions: Set[str]) -> bool:
     Returns:
         bool: 허용된 확장자면 True
     """
-    if not filename or '.' not in filename:
+    if not filename:
         return False
     
-    ext = filename.rsplit('.', 1)[1].lower()
-    return ext in allowed_extensions
+    # rpartition: 구분자가 없으면 dot == '' (리스트 할당 없는 고정 3-튜플)
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in allowed_extensions
 
 
 def validate_file(
@@ -66,21 +78,15 @@ def validate_file(
     # 확장자 확인
     if not allowed_file(file.filename, allowed_extensions):
         error_msg = "허용되지 않는 파일 형식입니다"
-        logger.warning(f"{error_msg} (업로드된 파일: {file.filename})")
+        logger.warning("%s (업로드된 파일: %s)", error_msg, file.filename)
         return False, error_msg
     
     # MIME 타입 확인
-    allowed_mime_types = {
-        'image/jpeg',
-        'image/png',
-        'image/jpg'
-    }
-    
-    if file.content_type and file.content_type not in allowed_mime_types:
+    if file.content_type and file.content_type not in _ALLOWED_MIME_TYPES:
         error_msg = "잘못된 파일 형식입니다"
         logger.warning(
-            f"의심스러운 MIME 타입: {file.content_type} "
-            f"(파일명: {file.filename})"
+            "의심스러운 MIME 타입: %s (파일명: %s)",
+            file.content_type, file.filename
         )
         return False, error_msg
     
@@ -94,21 +100,21 @@ def validate_file(
             max_mb = max_size / (1024 * 1024)
             error_msg = f"파일 크기가 너무 큽니다. 최대 {max_mb:.1f}MB까지 허용됩니다"
             logger.warning(
-                f"{error_msg} (업로드 크기: {file_size / (1024 * 1024):.2f}MB)"
+                "%s (업로드 크기: %.2fMB)", error_msg, file_size / (1024 * 1024)
             )
             return False, error_msg
         
         if file_size == 0:
             error_msg = "빈 파일입니다"
-            logger.warning(f"{error_msg} (파일명: {file.filename})")
+            logger.warning("%s (파일명: %s)", error_msg, file.filename)
             return False, error_msg
     
         logger.info(
-            f"파일 검증 통과: {file.filename} "
-            f"({file.content_type}, {file_size} bytes)"
+            "파일 검증 통과: %s (%s, %d bytes)",
+            file.filename, file.content_type, file_size
         )
     else:
-        logger.info(f"파일 검증 통과: {file.filename} ({file.content_type})")
+        logger.info("파일 검증 통과: %s (%s)", file.filename, file.content_type)
     
     return True, None
 
@@ -127,13 +133,12 @@ def validate_image_header(file_bytes: bytes) -> bool:
         logger.debug("파일이 너무 작아서 매직 넘버를 확인할 수 없음")
         return False
     
-    # JPEG 매직 넘버: FF D8 FF
-    if file_bytes[:3] == b'\xff\xd8\xff':
+    # startswith는 슬라이스 복사 없이 버퍼를 직접 비교
+    if file_bytes.startswith(_JPEG_SOI):
         logger.debug("JPEG 이미지로 확인됨")
         return True
     
-    # PNG 매직 넘버: 89 50 4E 47 0D 0A 1A 0A
-    if file_bytes[:8] == b'\x89PNG\r\n\x1a\n':
+    if file_bytes.startswith(_PNG_SIGNATURE):
         logger.debug("PNG 이미지로 확인됨")
         return True
     
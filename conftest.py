@@ -4,6 +4,7 @@ Pytest 설정 파일
 테스트 환경 초기화, fixture 정의, 설정 관리
 """
 
+import io
 import pytest
 import sys
 from pathlib import Path
@@ -12,6 +13,8 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from tests._image_factory import make_image_bytes, make_jpeg_declaring_size
+
 
 @pytest.fixture(scope='session')
 def app():
@@ -34,88 +37,47 @@ Flask 테스트 클라이언트 fixture (각 테스트마다)
     return app.test_client()
 
 
-@pytest.fixture(scope='session')
+# 이미지 fixture: 인코딩은 make_image_bytes가 세션당 1회만 수행하고,
+# 각 테스트에는 새 BytesIO를 전달 (업로드 시 스트림이 소비·종료되어도 다른 테스트에 영향 없음)
+
+@pytest.fixture
 def sample_image_valid():
-    """유효한 샘플 이미지 (JPEG)"""
-    from PIL import Image
-    import io
-    
-    # 224x224 RGB 이미지 생성
-    img = Image.new('RGB', (224, 224), color='blue')
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='JPEG')
-    img_bytes.seek(0)
-    
-    return img_bytes
+    """유효한 샘플 이미지 (JPEG, 224x224)"""
+    return io.BytesIO(make_image_bytes(224, 224, 'blue'))
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def sample_image_png():
-    """유효한 샘플 이미지 (PNG)"""
-    from PIL import Image
-    import io
-    
-    # 300x300 RGB 이미지 생성
-    img = Image.new('RGB', (300, 300), color='green')
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='PNG')
-    img_bytes.seek(0)
-    
-    return img_bytes
+    """유효한 샘플 이미지 (PNG, 300x300)"""
+    return io.BytesIO(make_image_bytes(300, 300, 'green', fmt='PNG'))
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def sample_image_small():
-    """너무 작은 이미지 (검증 실패용)"""
-    from PIL import Image
-    import io
-    
-    # 20x20 이미지 (최소 크기 32x32 미만)
-    img = Image.new('RGB', (20, 20), color='red')
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='JPEG')
-    img_bytes.seek(0)
-    
-    return img_bytes
+    """너무 작은 이미지 (검증 실패용) — 20x20, 최소 크기 32x32 미만"""
+    return io.BytesIO(make_image_bytes(20, 20, 'red'))
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def sample_image_large():
-    """너무 큰 이미지 (검증 실패용)"""
-    from PIL import Image
-    import io
-    
-    # 5000x5000 이미지 (최대 크기 4096x4096 초과)
-    img = Image.new('RGB', (5000, 5000), color='yellow')
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='JPEG')
-    img_bytes.seek(0)
-    
-    return img_bytes
+    """너무 큰 이미지 (검증 실패용) — 5000x5000, 최대 크기 4096x4096 초과
 
+    크기 검증은 헤더만 읽으므로 SOF에 5000x5000을 기록한 작은 JPEG로 대체
+    (실제 5000x5000 인코딩은 세션 시작 시 ~140ms 소요)
+    """
+    return io.BytesIO(make_jpeg_declaring_size(5000, 5000))
 
-@pytest.fixture(scope='session')
+
+@pytest.fixture
 def sample_image_wrong_aspect():
-    """비정상적인 가로세로 비율 이미지"""
-    from PIL import Image
-    import io
-    
-    # 1000x50 이미지 (비율 20:1 > 최대 10:1)
-    img = Image.new('RGB', (1000, 50), color='purple')
-    img_bytes = io.BytesIO()
-    img.save(img_bytes, format='JPEG')
-    img_bytes.seek(0)
-    
-    return img_bytes
+    """비정상적인 가로세로 비율 이미지 — 1000x50, 비율 20:1 > 최대 10:1"""
+    return io.BytesIO(make_image_bytes(1000, 50, 'purple'))
 
 
-@pytest.fixture(scope='session')
+@pytest.fixture
 def sample_text_file():
     """텍스트 파일 (이미지가 아님)"""
-    import io
-    
-    content = b"This is a text file, not an image!"
-    return io.BytesIO(content)
+    return io.BytesIO(b"This is a text file, not an image!")
 
 
 @pytest.fixture(scope='session')
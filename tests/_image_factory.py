@@ -0,0 +1,62 @@
+"""
+테스트용 이미지 바이트 생성 헬퍼
+
+같은 인자의 인코딩 결과는 테스트 세션 동안 한 번만 생성해 재사용합니다.
+반환값은 불변 bytes이므로 여러 테스트가 공유해도 커서 상태가 섞이지 않습니다.
+"""
+
+import struct
+from functools import lru_cache
+from io import BytesIO
+
+from PIL import Image
+
+
+@lru_cache(maxsize=None)
+def make_image_bytes(
+    width: int,
+    height: int,
+    color=(128, 128, 128),
+    fmt: str = 'JPEG',
+    mode: str = 'RGB',
+    quality: int = None
+) -> bytes:
+    """
+    단색 이미지를 지정 형식으로 인코딩한 바이트 반환
+
+    Args:
+        width, height: 이미지 크기
+        color: PIL 색상 (이름, 정수 또는 튜플 — 해시 가능해야 함)
+        fmt: 저장 형식 ('JPEG', 'PNG' 등)
+        mode: PIL 모드 ('RGB', 'L', 'RGBA' 등)
+        quality: JPEG 품질 (None이면 PIL 기본값)
+    """
+    img = Image.new(mode, (width, height), color=color)
+    buf = BytesIO()
+    if quality is None:
+        img.save(buf, format=fmt)
+    else:
+        img.save(buf, format=fmt, quality=quality)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def make_jpeg_declaring_size(width: int, height: int) -> bytes:
+    """
+    SOF 헤더에만 width x height를 기록한 작은 JPEG 반환
+
+    실제 픽셀은 8x8이므로 인코딩 비용이 거의 없습니다. 헤더로 크기를 판정하는
+    검증(최대 크기 초과 등)을 시험할 때, 대형 이미지를 실제로 인코딩하는 대신 사용합니다.
+    디코딩까지 수행하는 테스트에는 사용하지 마십시오.
+    """
+    data = bytearray(make_image_bytes(8, 8, 'white'))
+    pos = 2  # SOI 다음
+    while pos + 4 <= len(data):
+        marker = data[pos + 1]
+        seg_len = struct.unpack('>H', data[pos + 2:pos + 4])[0]
+        if marker == 0xC0:  # SOF0 (baseline) — PIL 기본 인코딩
+            # 세그먼트: 길이(2) · 정밀도(1) · 높이(2) · 너비(2)
+            struct.pack_into('>HH', data, pos + 5, height, width)
+            return bytes(data)
+        pos += 2 + seg_len
+    raise ValueError("SOF0 세그먼트를 찾을 수 없습니다")
@@ -8,7 +8,6 @@ import pytest
 import tempfile
 from pathlib import Path
 from io import BytesIO
-from PIL import Image
 import numpy as np
 
 # 백엔드 경로 추가
@@ -16,6 +15,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../b
 
 from app import create_app
 from config import TestingConfig
+from tests._image_factory import make_image_bytes
 
 
 @pytest.fixture(scope='session')
@@ -23,12 +23,12 @@ def test_config():
     return TestingConfig()
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def app(test_config):
-    app = create_app('testing')
-    app.config['TESTING'] = True
-    app.config['WTF_CSRF_ENABLED'] = False
-    yield app
+    # 앱 생성(설정·로거·블루프린트·ONNX 세션 로드)은 세션당 1회
+    # - TESTING 등 테스트 전용 설정은 TestingConfig에 정의
+    # - 요청 단위 격리는 함수 범위 client(test_client)가 담당
+    yield create_app('testing')
 
 
 @pytest.fixture(scope='function')
@@ -43,38 +43,22 @@ def runner(app):
 
 @pytest.fixture(scope='session')
 def sample_image_bytes():
-    img = Image.new('RGB', (224, 224), color='red')
-    buf = BytesIO()
-    img.save(buf, format='JPEG')
-    buf.seek(0)
-    return buf.read()
+    return make_image_bytes(224, 224, 'red')
 
 
 @pytest.fixture(scope='session')
 def sample_png_bytes():
-    img = Image.new('RGB', (224, 224), color='blue')
-    buf = BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return buf.read()
+    return make_image_bytes(224, 224, 'blue', fmt='PNG')
 
 
 @pytest.fixture(scope='session')
 def large_image_bytes():
-    img = Image.new('RGB', (4096, 4096), color='green')
-    buf = BytesIO()
-    img.save(buf, format='JPEG', quality=95)
-    buf.seek(0)
-    return buf.read()
+    return make_image_bytes(4096, 4096, 'green', quality=95)
 
 
 @pytest.fixture(scope='session')
 def small_image_bytes():
-    img = Image.new('RGB', (10, 10), color='yellow')
-    buf = BytesIO()
-    img.save(buf, format='JPEG')
-    buf.seek(0)
-    return buf.read()
+    return make_image_bytes(10, 10, 'yellow')
 
 
 @pytest.fixture(scope='session')
@@ -84,20 +68,12 @@ def corrupted_image_bytes():
 
 @pytest.fixture(scope='session')
 def grayscale_image_bytes():
-    img = Image.new('L', (224, 224), color=128)
-    buf = BytesIO()
-    img.save(buf, format='JPEG')
-    buf.seek(0)
-    return buf.read()
+    return make_image_bytes(224, 224, 128, mode='L')
 
 
 @pytest.fixture(scope='session')
 def rgba_image_bytes():
-    img = Image.new('RGBA', (224, 224), color=(255, 0, 0, 128))
-    buf = BytesIO()
-    img.save(buf, format='PNG')
-    buf.seek(0)
-    return buf.read()
+    return make_image_bytes(224, 224, (255, 0, 0, 128), fmt='PNG', mode='RGBA')
 
 
 @pytest.fixture(scope='session')
@@ -111,11 +87,7 @@ def sample_image_valid():
     API 테스트용 유효한 이미지 BytesIO.
     scope='function': 닫힌 파일 재사용 오류 방지.
     """
-    img = Image.new('RGB', (224, 224), color=(128, 128, 128))
-    buf = BytesIO()
-    img.save(buf, format='JPEG')
-    buf.seek(0)
-    return buf
+    return BytesIO(make_image_bytes(224, 224, (128, 128, 128)))
 
 
 @pytest.fixture(scope='function')
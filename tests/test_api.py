@@ -167,69 +167,29 @@ class TestPredictEndpoint:
             # error_type은 MODEL_NOT_LOADED (에러 코드) 또는 ModelNotLoadedError (클래스명)
             assert result['error_type'] in ['MODEL_NOT_LOADED', 'ModelNotLoadedError']
     
-    @pytest.mark.api
-    def test_predict_with_valid_png(self, client, sample_image_png):
-        """POST /predict - 유효한 PNG 이미지로 예측"""
-        data = {
-            'file': (sample_image_png, 'test_image.png', 'image/png')
-        }
-        
-        response = client.post(
-            '/predict',
-            data=data,
-            content_type='multipart/form-data'
-        )
-        
-        assert response.status_code in [200, 503]
-    
-    @pytest.mark.api
-    @pytest.mark.validation
-    def test_predict_with_text_file(self, client, sample_text_file):
-        """POST /predict - 텍스트 파일"""
-        data = {
-            'file': (sample_text_file, 'test.txt', 'text/plain')
-        }
-        
-        response = client.post(
-            '/predict',
-            data=data,
-            content_type='multipart/form-data'
-        )
-        
-        # 모델이 로드되지 않으면 503, 파일 검증 실패 시 400
-        assert response.status_code in [400, 503]
-        result = response.get_json()
-        
-        assert result['success'] is False
-        assert 'error' in result
-    
-    @pytest.mark.api
-    @pytest.mark.validation
-    def test_predict_with_small_image(self, client, sample_image_small):
-        """POST /predict - 너무 작은 이미지"""
-        data = {
-            'file': (sample_image_small, 'small.jpg', 'image/jpeg')
-        }
-        
-        response = client.post(
-            '/predict',
-            data=data,
-            content_type='multipart/form-data'
-        )
-        
-        # 모델이 로드되지 않으면 503, 이미지 검증 실패 시 400
-        assert response.status_code in [400, 503]
-        result = response.get_json()
-        
-        assert result['success'] is False
-        assert 'error_type' in result
-    
     @pytest.mark.api
     @pytest.mark.validation
-    def test_predict_with_large_image(self, client, sample_image_large):
-        """POST /predict - 너무 큰 이미지"""
+    @pytest.mark.parametrize(
+        "fixture_name, filename, content_type, expected_status",
+        [
+            # 유효한 PNG — 모델 미준비 시 503
+            ("sample_image_png", "test_image.png", "image/png", (200, 503)),
+            # 텍스트 파일 — 파일 검증 실패 400
+            ("sample_text_file", "test.txt", "text/plain", (400, 503)),
+            # 너무 작은 이미지 — 이미지 검증 실패 400
+            ("sample_image_small", "small.jpg", "image/jpeg", (400, 503)),
+            # 너무 큰 이미지 — 이미지 검증 실패 400
+            ("sample_image_large", "large.jpg", "image/jpeg", (400, 503)),
+        ],
+        ids=["valid_png", "text_file", "small_image", "large_image"],
+    )
+    def test_predict_upload_status(
+        self, request, client, fixture_name, filename, content_type, expected_status
+    ):
+        """POST /predict - 업로드 종류별 응답 상태"""
+        upload = request.getfixturevalue(fixture_name)
         data = {
-            'file': (sample_image_large, 'large.jpg', 'image/jpeg')
+            'file': (upload, filename, content_type)
         }
         
         response = client.post(
@@ -238,11 +198,13 @@ class TestPredictEndpoint:
             content_type='multipart/form-data'
         )
         
-        # 모델이 로드되지 않으면 503, 이미지 검증 실패 시 400
-        assert response.status_code in [400, 503]
-        result = response.get_json()
+        assert response.status_code in expected_status
         
-        assert result['success'] is False
+        if 200 not in expected_status:
+            result = response.get_json()
+            assert result['success'] is False
+            assert 'error' in result
+            assert 'error_type' in result
 
 
 class TestErrorHandlers:
@@ -271,6 +233,19 @@ class TestErrorHandlers:
         assert data['success'] is False
         assert data['error_type'] == 'MethodNotAllowedError'
 
+    @pytest.mark.unit
+    def test_predict_error_handler_matches_subclass(self):
+        """/predict 예외 매핑 - 등록된 예외의 하위 클래스도 같은 핸들러 사용"""
+        from backend.routes.predict import _ERROR_HANDLERS, _resolve_error_handler
+        from backend.utils import InvalidImageError
+        from backend.utils.exceptions import AIClassifierException
+
+        class CorruptImageError(InvalidImageError):
+            pass
+
+        assert _resolve_error_handler(CorruptImageError("손상")) is _ERROR_HANDLERS[InvalidImageError]
+        assert _resolve_error_handler(AIClassifierException("기타")) is None
+
 
 class TestCORSHeaders:
     """CORS 헤더 테스트"""
@@ -9,10 +9,11 @@ ModelService 캐시 단위 테스트
   - 테스트 전후 캐시 상태 초기화 (fixture)
 """
 
+from functools import lru_cache
+
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
-from collections import OrderedDict
 
 from backend.services.model_service import ModelService
 
@@ -20,57 +21,75 @@ from backend.services.model_service import ModelService
 # ─── 픽스처 ───────────────────────────────────────────────────────
 
 
+_CLASS_NAMES = ('정상', '폐렴')
+
+
+def _ranked(indices, probs):
+    """predict_arrays() 반환 형식 — 읽기 전용 (인덱스, 확률) 배열 쌍"""
+    indices = np.array(indices, dtype=np.int32)
+    probs = np.array(probs, dtype=np.float32)
+    indices.flags.writeable = False
+    probs.flags.writeable = False
+    return indices, probs
+
+
 @pytest.fixture
 def mock_predictor():
-    """ModelPredictor 모의 객체 — is_ready() True, predict()는 고정 결과 반환"""
+    """ModelPredictor 모의 객체 — is_ready() True, predict_arrays()는 고정 결과 반환"""
     predictor = MagicMock()
     predictor.is_ready.return_value = True
-    predictor.predict.return_value = [
-        {'className': '정상', 'probability': 0.85},
-        {'className': '폐렴', 'probability': 0.15}
+    predictor.predict_arrays.return_value = _ranked([0, 1], [0.85, 0.15])
+    predictor.format_predictions.side_effect = lambda indices, probs: [
+        {'className': _CLASS_NAMES[i], 'probability': p}
+        for i, p in zip(indices.tolist(), probs.tolist())
     ]
     return predictor
 
 
 @pytest.fixture
-def service(mock_predictor) -> ModelService:
+def service(mocker, mock_predictor) -> ModelService:
     """캐싱 활성화된 ModelService (cache_size=4)
 
-    ModelPredictor 생성자와 load_model을 패치하여
-    실제 모델 파일 없이 테스트합니다.
+    ModelPredictor 생성자를 패치하여 실제 모델 파일 없이 테스트합니다.
     """
-    with patch('backend.services.model_service.ModelPredictor') as MockClass:
-        MockClass.return_value = mock_predictor
-        svc = ModelService(
-            model_path='dummy.onnx',
-            labels_path='dummy_labels.txt',
-            enable_cache=True,
-            cache_size=4
-        )
-        # 직접 _predictor를 주입하여 load_model() 호출 불필요
-        svc._predictor = mock_predictor
-        svc.stats['warmup_completed'] = True
+    mocker.patch('backend.services.model_service.ModelPredictor', return_value=mock_predictor)
+    svc = ModelService(
+        model_path='dummy.onnx',
+        labels_path='dummy_labels.txt',
+        enable_cache=True,
+        cache_size=4
+    )
+    # 직접 _predictor를 주입하여 load_model() 호출 불필요
+    svc._predictor = mock_predictor
+    svc.stats['warmup_completed'] = True
     return svc
 
 
 @pytest.fixture
-def no_cache_service(mock_predictor) -> ModelService:
+def no_cache_service(mocker, mock_predictor) -> ModelService:
     """캐싱 비활성화된 ModelService"""
-    with patch('backend.services.model_service.ModelPredictor'):
-        svc = ModelService(
-            model_path='dummy.onnx',
-            labels_path='dummy_labels.txt',
-            enable_cache=False
-        )
-        svc._predictor = mock_predictor
-        svc.stats['warmup_completed'] = True
+    mocker.patch('backend.services.model_service.ModelPredictor')
+    svc = ModelService(
+        model_path='dummy.onnx',
+        labels_path='dummy_labels.txt',
+        enable_cache=False
+    )
+    svc._predictor = mock_predictor
+    svc.stats['warmup_completed'] = True
     return svc
 
 
+@lru_cache(maxsize=None)
 def _make_image(seed: int) -> np.ndarray:
-    """재현가능한 더미 이미지 생성 (seed가 다르면 해시도 다름)"""
+    """재현가능한 더미 이미지 생성 (seed가 다르면 해시도 다름)
+
+    같은 seed는 세션 동안 같은 배열을 공유하므로 읽기 전용으로 반환합니다.
+    """
     rng = np.random.default_rng(seed)
-    return rng.random((1, 3, 224, 224)).astype(np.float32)
+    # float32로 직접 생성 (float64 생성 후 astype 복사 없음)
+    img = rng.random((1, 3, 224, 224), dtype=np.float32)
+    img.flags.writeable = False
+    return img
 
 
 # ─── 기본 동작 테스트 ─────────────────────────────────────────────
@@ -86,15 +105,16 @@ class TestModelServiceBasic:
 
     @pytest.mark.unit
     def test_predict_returns_tuple(self, service):
-        """predict()는 (predictions, from_cache) 튜플을 반환"""
+        """predict()는 ((indices, probs), from_cache) 튜플을 반환"""
         img = _make_image(0)
         result = service.predict(img)
 
         assert isinstance(result, tuple)
         assert len(result) == 2
 
-        predictions, from_cache = result
-        assert isinstance(predictions, list)
+        (indices, probs), from_cache = result
+        assert indices.dtype == np.int32
+        assert probs.dtype == np.float32
         assert isinstance(from_cache, bool)
 
     @pytest.mark.unit
@@ -104,7 +124,7 @@ class TestModelServiceBasic:
         predictions, from_cache = service.predict(img)
 
         assert from_cache is False
-        mock_predictor.predict.assert_called_once()
+        mock_predictor.predict_arrays.assert_called_once()
 
     @pytest.mark.unit
     def test_predict_second_call_is_hit(self, service, mock_predictor):
@@ -112,12 +132,49 @@ class TestModelServiceBasic:
         img = _make_image(2)
 
         service.predict(img)                 # 1st — miss
-        mock_predictor.predict.reset_mock()  # 카운터 초기화
+        mock_predictor.predict_arrays.reset_mock()  # 카운터 초기화
 
         predictions, from_cache = service.predict(img)  # 2nd — hit
 
         assert from_cache is True
-        mock_predictor.predict.assert_not_called()
+        mock_predictor.predict_arrays.assert_not_called()
+
+    @pytest.mark.unit
+    def test_cache_hit_returns_read_only_arrays(self, service, mock_predictor):
+        """캐시 히트는 저장된 배열 쌍을 복사 없이 반환하며, 호출 측 수정은 차단"""
+        img = _make_image(3)
+
+        service.predict(img)                             # miss → 저장
+        hit, from_cache = service.predict(img)           # hit
+        assert from_cache is True
+        assert hit is mock_predictor.predict_arrays.return_value
+
+        with pytest.raises(ValueError):
+            hit[1][0] = 0.0                              # 호출 측 수정 시도
+
+    @pytest.mark.unit
+    def test_format_predictions_builds_response_dicts(self, service):
+        """format_predictions()는 응답 직전에 dict 리스트로 변환"""
+        ranked, _ = service.predict(_make_image(6))
+
+        predictions = service.format_predictions(ranked)
+
+        assert [p['className'] for p in predictions] == ['정상', '폐렴']
+        assert predictions[0]['probability'] == pytest.approx(0.85)
+
+    @pytest.mark.unit
+    def test_explicit_cache_key_skips_hashing(self, service, mock_predictor):
+        """cache_key를 넘기면 텐서 해시 없이 해당 키로 조회·저장"""
+        key = b'k' * 16
+
+        with patch.object(service, '_compute_image_hash') as mock_hash:
+            _, first = service.predict(_make_image(4), cache_key=key)
+            _, second = service.predict(_make_image(5), cache_key=key)
+
+        mock_hash.assert_not_called()
+        assert first is False
+        assert second is True
+        assert key in service._cache
 
     @pytest.mark.unit
     def test_predict_different_images_both_miss(self, service, mock_predictor):
@@ -130,14 +187,14 @@ class TestModelServiceBasic:
 
         assert from_a is False
         assert from_b is False
-        assert mock_predictor.predict.call_count == 2
+        assert mock_predictor.predict_arrays.call_count == 2
 
 
 # ─── LRU 퇴장 정책 테스트 ─────────────────────────────────────────
 
 
 class TestLRUEviction:
-    """OrderedDict 기반 LRU 퇴장 정책 검증 (cache_size=4)"""
+    """접근 카운터 기반 LRU 퇴장 정책 검증 (cache_size=4)"""
 
     @pytest.mark.unit
     def test_eviction_removes_oldest(self, service):
@@ -163,7 +220,7 @@ class TestLRUEviction:
         """조회된 항목은 퇴장 우선순위가 낮아짐
 
         저장 순서: A B C D
-        A를 다시 조회 → 내부 순서: B C D A
+        A를 다시 조회 → 접근 순서: B C D A
         E 저장 → B가 퇴장 (A는 최근 사용이므로 유지)
         """
         images = {k: _make_image(k) for k in range(5)}  # A=0 B=1 C=2 D=3 E=4
@@ -172,7 +229,7 @@ class TestLRUEviction:
         for k in range(4):
             service.predict(images[k])
 
-        # A를 다시 조회 (hit → move_to_end)
+        # A를 다시 조회 (hit → 접근 카운터 갱신으로 최신화)
         service.predict(images[0])
 
         hash_b = service._compute_image_hash(images[1])
@@ -193,6 +250,20 @@ class TestLRUEviction:
             assert len(service._cache) <= 4
 
 
+    @pytest.mark.unit
+    def test_concurrent_predicts_keep_cache_consistent(self, service):
+        """여러 스레드가 동시에 predict()해도 캐시 크기 제한 유지 + 예외 없음"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        images = [_make_image(i + 300) for i in range(16)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(service.predict, images * 4))
+
+        assert len(results) == 64
+        assert len(service._cache) <= 4
+
+
 # ─── 통계 테스트 ──────────────────────────────────────────────────
 
 
@@ -212,6 +283,21 @@ class TestCacheStatistics:
         assert service.stats['cache_misses'] == 1
         assert service.stats['total_predictions'] == 3
 
+    @pytest.mark.unit
+    def test_stats_exact_under_concurrency(self, service):
+        """동시 predict() 호출에서도 카운터 유실 없음"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        img = _make_image(52)
+        service.predict(img)   # miss (이후 모두 hit)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: service.predict(img), range(400)))
+
+        assert service.stats['total_predictions'] == 401
+        assert service.stats['cache_hits'] == 400
+        assert service.stats['cache_misses'] == 1
+
     @pytest.mark.unit
     def test_get_statistics_hit_rate(self, service):
         """get_statistics()의 cache_hit_rate_percent 계산 정확성"""
@@ -235,7 +321,10 @@ class TestCacheStatistics:
 
         info = service.get_cache_info()
         assert info['currsize'] == 3
-        assert info['maxsize'] == 4
+        assert info['tensor_currsize'] == 3
+        assert info['raw_currsize'] == 0
+        # 텐서·원본 두 계층 합계 상한
+        assert info['maxsize'] == 8
 
 
 # ─── 캐시 초기화 테스트 ───────────────────────────────────────────
@@ -265,12 +354,12 @@ class TestCacheClear:
         service.predict(img)           # miss
         service.predict(img)           # hit
         service.clear_cache()
-        mock_predictor.predict.reset_mock()
+        mock_predictor.predict_arrays.reset_mock()
 
         _, from_cache = service.predict(img)  # miss again
 
         assert from_cache is False
-        mock_predictor.predict.assert_called_once()
+        mock_predictor.predict_arrays.assert_called_once()
 
 
 # ─── 캐싱 비활성화 모드 테스트 ────────────────────────────────────
@@ -287,7 +376,7 @@ class TestCacheDisabled:
         no_cache_service.predict(img)
         no_cache_service.predict(img)
 
-        assert mock_predictor.predict.call_count == 2
+        assert mock_predictor.predict_arrays.call_count == 2
 
     @pytest.mark.unit
     def test_no_cache_from_cache_always_false(self, no_cache_service):
@@ -333,8 +422,188 @@ class TestImageHashing:
         assert h1 != h2
 
     @pytest.mark.unit
-    def test_hash_is_sha256_hex(self, service):
-        """해시는 64자리 SHA-256 hex 문자열"""
+    def test_same_bytes_different_shape_different_hash(self, service):
+        """바이트가 같아도 shape가 다르면 다른 해시"""
+        img = _make_image(85)
+        h1 = service._compute_image_hash(img)
+        h2 = service._compute_image_hash(img.reshape(1, 224, 224, 3))
+        assert h1 != h2
+
+    @pytest.mark.unit
+    def test_hash_is_128bit_digest(self, service):
+        """해시는 16바이트(128-bit) raw digest"""
         h = service._compute_image_hash(_make_image(83))
-        assert len(h) == 64
-        assert all(c in '0123456789abcdef' for c in h)
+        assert isinstance(h, bytes)
+        assert len(h) == 16
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('xxhash_on, blake3_on', [(False, True), (False, False)])
+    def test_hash_fallbacks_match_width(self, service, xxhash_on, blake3_on):
+        """xxhash / BLAKE3 미설치 시 폴백 해시도 동일한 키 길이 유지"""
+        img = _make_image(84)
+        with patch('backend.services.model_service.XXHASH_AVAILABLE', xxhash_on), \
+                patch('backend.services.model_service.BLAKE3_AVAILABLE', blake3_on):
+            h1 = service._compute_image_hash(img)
+            h2 = service._compute_image_hash(img)
+        assert len(h1) == 16
+        assert h1 == h2
+
+
+# ─── 원본 바이트 캐시 테스트 ──────────────────────────────────────
+
+
+class TestRawBytesCache:
+    """predict_from_bytes() — 전처리 이전 단계 캐시 검증"""
+
+    @pytest.mark.unit
+    def test_raw_hit_skips_preprocess(self, service, mock_predictor):
+        """동일 바이트 재요청 시 전처리·추론 모두 생략"""
+        preprocess = MagicMock(return_value=_make_image(90))
+
+        _, fc1 = service.predict_from_bytes(b'raw-image-90', preprocess)
+        _, fc2 = service.predict_from_bytes(b'raw-image-90', preprocess)
+
+        assert fc1 is False
+        assert fc2 is True
+        preprocess.assert_called_once()
+        mock_predictor.predict_arrays.assert_called_once()
+        assert service.stats['total_predictions'] == 2
+        assert service.stats['cache_hits'] == 1
+
+    @pytest.mark.unit
+    def test_raw_miss_falls_back_to_tensor_cache(self, service, mock_predictor):
+        """바이트가 달라도 전처리 결과가 같으면 텐서 캐시 히트"""
+        preprocess = MagicMock(return_value=_make_image(91))
+
+        service.predict_from_bytes(b'raw-image-91-a', preprocess)
+        _, from_cache = service.predict_from_bytes(b'raw-image-91-b', preprocess)
+
+        assert from_cache is True
+        assert preprocess.call_count == 2
+        mock_predictor.predict_arrays.assert_called_once()
+
+    @pytest.mark.unit
+    def test_no_cache_always_preprocesses(self, no_cache_service, mock_predictor):
+        """캐싱 비활성화 시 매번 전처리 + 추론"""
+        preprocess = MagicMock(return_value=_make_image(92))
+
+        no_cache_service.predict_from_bytes(b'raw-image-92', preprocess)
+        no_cache_service.predict_from_bytes(b'raw-image-92', preprocess)
+
+        assert preprocess.call_count == 2
+        assert mock_predictor.predict_arrays.call_count == 2
+
+    @pytest.mark.unit
+    def test_cache_info_counts_both_layers(self, service):
+        """get_cache_info()는 원본 바이트 계층 항목도 함께 집계"""
+        preprocess = MagicMock(side_effect=lambda data: _make_image(len(data)))
+
+        service.predict_from_bytes(b'raw-image-93', preprocess)
+        service.predict_from_bytes(b'raw-image-093', preprocess)
+
+        info = service.get_cache_info()
+        assert info['tensor_currsize'] == 2
+        assert info['raw_currsize'] == 2
+        assert info['currsize'] == 4
+
+
+# ─── 일괄 예측 테스트 ─────────────────────────────────────────────
+
+
+def _fixed_batch_result(batch):
+    """predict_batch 모의 — 배치 행 수만큼 고정 결과 반환"""
+    return [_ranked([0, 1], [0.85, 0.15]) for _ in range(len(batch))]
+
+
+class TestPredictBatch:
+    """predict_batch() — 캐시 미스만 묶어 1회 추론"""
+
+    @pytest.mark.unit
+    def test_only_misses_are_inferred_in_one_call(self, service, mock_predictor):
+        """캐시 히트와 배치 내 중복은 제외하고 한 번에 추론"""
+        mock_predictor.predict_batch.side_effect = _fixed_batch_result
+        cached = _make_image(130)
+        service.predict(cached)
+
+        batch = np.concatenate([cached, _make_image(131), _make_image(132), _make_image(131)])
+        results = service.predict_batch(batch)
+
+        mock_predictor.predict_batch.assert_called_once()
+        assert mock_predictor.predict_batch.call_args[0][0].shape[0] == 2
+        assert [from_cache for _, from_cache in results] == [True, False, False, True]
+        assert service.stats['total_predictions'] == 5
+        assert service.stats['cache_hits'] == 2
+        assert service.stats['cache_misses'] == 3
+
+    @pytest.mark.unit
+    def test_all_hits_skip_inference(self, service, mock_predictor):
+        """모두 캐시 히트면 predictor를 호출하지 않음"""
+        img = _make_image(133)
+        service.predict(img)
+
+        results = service.predict_batch(np.concatenate([img, img]))
+
+        mock_predictor.predict_batch.assert_not_called()
+        assert [from_cache for _, from_cache in results] == [True, True]
+
+    @pytest.mark.unit
+    def test_no_cache_infers_every_image(self, no_cache_service, mock_predictor):
+        """캐싱 비활성화 시 중복 이미지도 모두 추론"""
+        mock_predictor.predict_batch.side_effect = _fixed_batch_result
+        img = _make_image(134)
+
+        results = no_cache_service.predict_batch(np.concatenate([img, img]))
+
+        assert mock_predictor.predict_batch.call_args[0][0].shape[0] == 2
+        assert [from_cache for _, from_cache in results] == [False, False]
+
+
+# ─── 캐시 승인 필터 테스트 ────────────────────────────────────────
+
+
+class TestCacheAdmission:
+    """admission_window > 0 — 두 번째 관측부터 캐시 저장"""
+
+    @pytest.mark.unit
+    def test_one_shot_inputs_do_not_evict(self, service):
+        """한 번만 등장한 키는 캐시에 저장되지 않아 기존 항목을 밀어내지 않음"""
+        service.admission_window = 16
+        hot = _make_image(100)
+
+        service.predict(hot)                  # 1st — 관측만
+        service.predict(hot)                  # 2nd — 승인 → 저장
+        _, from_cache = service.predict(hot)  # 3rd — 히트
+        assert from_cache is True
+
+        for i in range(8):                    # 일회성 입력 8개 (cache_size=4 초과)
+            service.predict(_make_image(i + 110))
+
+        assert list(service._cache) == [service._compute_image_hash(hot)]
+        _, from_cache = service.predict(hot)
+        assert from_cache is True
+
+    @pytest.mark.unit
+    def test_admission_window_forgets_oldest(self, service):
+        """창 크기를 넘어선 관측 기록은 잊혀 다시 거절됨"""
+        service.admission_window = 2
+        img = _make_image(120)
+
+        service.predict(img)                  # 관측: [img]
+        service.predict(_make_image(121))     # 관측: [img, 121]
+        service.predict(_make_image(122))     # 관측: [121, 122] — img 잊힘
+        service.predict(img)                  # 다시 첫 관측 → 저장 안 됨
+
+        assert len(service._cache) == 0
+
+    @pytest.mark.unit
+    def test_raw_and_tensor_layers_have_separate_windows(self, service):
+        """원본·텐서 키가 한 창을 나눠 쓰지 않음 — 창 크기만큼의 요청을 온전히 기억"""
+        service.admission_window = 2
+        preprocess = MagicMock(side_effect=lambda data: _make_image(len(data)))
+
+        service.predict_from_bytes(b'x' * 140, preprocess)   # 관측 (계층별 1개)
+        service.predict_from_bytes(b'x' * 141, preprocess)   # 관측 (계층별 2개)
+        service.predict_from_bytes(b'x' * 140, preprocess)   # 두 번째 관측 → 두 계층 모두 저장
+
+        assert len(service._raw_cache) == 1
+        assert len(service._cache) == 1
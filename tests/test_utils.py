@@ -9,39 +9,33 @@ import io
 from werkzeug.datastructures import FileStorage
 from PIL import Image
 
+from tests._image_factory import make_image_bytes
+
 
 class TestValidators:
     """파일 검증 함수 테스트"""
     
     @pytest.mark.unit
     @pytest.mark.validation
-    def test_allowed_file_with_valid_extensions(self):
-        """allowed_file - 유효한 확장자"""
-        from backend.utils.validators import allowed_file
-        
-        assert allowed_file('image.jpg', {'jpg', 'png'}) is True
-        assert allowed_file('photo.jpeg', {'jpg', 'jpeg', 'png'}) is True
-        assert allowed_file('picture.png', {'png'}) is True
-    
-    @pytest.mark.unit
-    @pytest.mark.validation
-    def test_allowed_file_with_invalid_extensions(self):
-        """allowed_file - 유효하지 않은 확장자"""
-        from backend.utils.validators import allowed_file
-        
-        assert allowed_file('document.txt', {'jpg', 'png'}) is False
-        assert allowed_file('script.py', {'jpg', 'png'}) is False
-        assert allowed_file('noextension', {'jpg', 'png'}) is False
-    
-    @pytest.mark.unit
-    @pytest.mark.validation
-    def test_allowed_file_case_insensitive(self):
-        """allowed_file - 대소문자 구분 없음"""
+    @pytest.mark.parametrize('filename, extensions, expected', [
+        # 유효한 확장자
+        ('image.jpg', {'jpg', 'png'}, True),
+        ('photo.jpeg', {'jpg', 'jpeg', 'png'}, True),
+        ('picture.png', {'png'}, True),
+        # 유효하지 않은 확장자
+        ('document.txt', {'jpg', 'png'}, False),
+        ('script.py', {'jpg', 'png'}, False),
+        ('noextension', {'jpg', 'png'}, False),
+        # 대소문자 구분 없음
+        ('IMAGE.JPG', {'jpg', 'png'}, True),
+        ('Photo.PNG', {'jpg', 'png'}, True),
+        ('picture.JpEg', {'jpg', 'jpeg', 'png'}, True),
+    ])
+    def test_allowed_file(self, filename, extensions, expected):
+        """allowed_file - 확장자 허용 여부 (대소문자 무시)"""
         from backend.utils.validators import allowed_file
         
-        assert allowed_file('IMAGE.JPG', {'jpg', 'png'}) is True
-        assert allowed_file('Photo.PNG', {'jpg', 'png'}) is True
-        assert allowed_file('picture.JpEg', {'jpg', 'jpeg', 'png'}) is True
+        assert allowed_file(filename, extensions) is expected
     
     @pytest.mark.unit
     @pytest.mark.validation
@@ -49,14 +43,9 @@ class TestValidators:
         """validate_file - 유효한 파일"""
         from backend.utils.validators import validate_file
         
-        # 작은 JPEG 이미지 생성
-        img = Image.new('RGB', (100, 100), color='blue')
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='JPEG')
-        img_bytes.seek(0)
-        
+        # 작은 JPEG 이미지
         file = FileStorage(
-            stream=img_bytes,
+            stream=io.BytesIO(make_image_bytes(100, 100, 'blue')),
             filename='test.jpg',
             content_type='image/jpeg'
         )
@@ -230,6 +219,18 @@ class TestExceptions:
         assert exc.message == "파일 검증 실패"
         assert exc.error_code == "FILE_VALIDATION_ERROR"
 
+    @pytest.mark.unit
+    def test_default_error_code_is_class_name(self):
+        """error_code 미지정 시 클래스 이름이 기본값"""
+        from backend.utils.exceptions import AIClassifierException
+
+        class CustomError(AIClassifierException):
+            pass
+
+        assert AIClassifierException("기본").error_code == "AIClassifierException"
+        assert CustomError("사용자 정의").error_code == "CustomError"
+        assert CustomError("재지정", error_code="CUSTOM").error_code == "CUSTOM"
+
 
 class TestImageValidator:
     """고급 이미지 검증기 테스트"""
@@ -243,13 +244,10 @@ class TestImageValidator:
         
         validator = ImageValidator()
         
-        # 유효한 JPEG 생성
-        img = Image.new('RGB', (100, 100), color='red')
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='JPEG')
-        img_bytes.seek(0)
-        
-        is_valid, img_format = validator.validate_magic_bytes(img_bytes.read())
+        # 유효한 JPEG
+        is_valid, img_format = validator.validate_magic_bytes(
+            make_image_bytes(100, 100, 'red')
+        )
         
         assert is_valid is True
         assert img_format == 'jpeg'
@@ -267,9 +265,29 @@ class TestImageValidator:
         text_bytes = b"This is not an image"
         
         is_valid, img_format = validator.validate_magic_bytes(text_bytes)
-        
+
         assert is_valid is False
-    
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    @pytest.mark.security
+    @pytest.mark.parametrize('header, expected', [
+        (b'\x89PNG\r\n\x1a\n' + b'\x00' * 8, 'png'),
+        (b'GIF87a' + b'\x00' * 8, 'gif'),
+        (b'GIF89a' + b'\x00' * 8, 'gif'),
+        (b'RIFF\x00\x00\x00\x00WEBPVP8 ', 'webp'),
+        (b'RIFF\x00\x00\x00\x00AVI LIST', None),
+        (b'GIF88a' + b'\x00' * 8, None),
+    ])
+    def test_validate_magic_bytes_formats(self, header, expected):
+        """매직 바이트 검증 - PNG / GIF / WebP 및 유사 시그니처"""
+        from backend.utils.advanced_validators import ImageValidator
+
+        is_valid, img_format = ImageValidator().validate_magic_bytes(header)
+
+        assert is_valid is (expected is not None)
+        assert img_format == expected
+
     @pytest.mark.unit
     @pytest.mark.validation
     def test_validate_image_dimensions_valid(self):
@@ -284,12 +302,9 @@ class TestImageValidator:
         )
         
         # 200x200 이미지 (유효)
-        img = Image.new('RGB', (200, 200), color='blue')
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-        
-        is_valid, error_msg = validator.validate_image_dimensions(img_bytes.read())
+        is_valid, error_msg = validator.validate_image_dimensions(
+            make_image_bytes(200, 200, 'blue', fmt='PNG')
+        )
         
         assert is_valid is True
         assert error_msg is None
@@ -303,12 +318,9 @@ class TestImageValidator:
         validator = ImageValidator(min_width=32, min_height=32)
         
         # 20x20 이미지 (너무 작음)
-        img = Image.new('RGB', (20, 20), color='red')
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-        
-        is_valid, error_msg = validator.validate_image_dimensions(img_bytes.read())
+        is_valid, error_msg = validator.validate_image_dimensions(
+            make_image_bytes(20, 20, 'red', fmt='PNG')
+        )
         
         assert is_valid is False
         assert '너무 작습니다' in error_msg
@@ -337,12 +349,278 @@ class TestImageValidator:
         )
         
         # 500x25 이미지 (비율 20:1 → max 10:1 초과)
-        img = Image.new('RGB', (500, 25), color='green')
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format='PNG')
-        img_bytes.seek(0)
-        
-        is_valid, error_msg = validator.validate_image_dimensions(img_bytes.read())
+        is_valid, error_msg = validator.validate_image_dimensions(
+            make_image_bytes(500, 25, 'green', fmt='PNG')
+        )
         
         assert is_valid is False
         assert '가로세로 비율' in error_msg
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    @pytest.mark.security
+    def test_validate_image_dimensions_rejects_oversize_bytes(self):
+        """이미지 크기 검증 - 파일 크기 초과 시 헤더 파싱 전 거절"""
+        from unittest.mock import patch
+        from backend.utils.advanced_validators import ImageValidator
+
+        validator = ImageValidator(max_bytes=64)
+        data = b'\x89PNG\r\n\x1a\n' + b'\x00' * 64
+
+        with patch('backend.utils.advanced_validators.Image.open') as mock_open:
+            is_valid, error_msg = validator.validate_image_dimensions(data)
+
+        assert is_valid is False
+        assert '너무 큽니다' in error_msg
+        mock_open.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    @pytest.mark.security
+    @pytest.mark.parametrize('truncate', ['png_ihdr_only', 'jpeg_headers_only'])
+    def test_comprehensive_validation_rejects_truncated(self, truncate):
+        """종합 검증 - 헤더 크기는 정상이지만 구조가 잘린 파일은 InvalidImageError"""
+        from backend.utils.advanced_validators import ImageValidator
+        from backend.utils.exceptions import InvalidImageError
+
+        if truncate == 'png_ihdr_only':
+            # 시그니처 + IHDR만 남은 40바이트 PNG
+            data = make_image_bytes(64, 64, 'red', fmt='PNG')[:40]
+        else:
+            # SOS(스캔 시작) 이전 헤더만 남은 JPEG
+            jpeg = make_image_bytes(64, 64, 'red')
+            data = jpeg[:jpeg.index(b'\xff\xda')]
+
+        validator = ImageValidator()
+        assert validator._peek_dims(data, validator.validate_magic_bytes(data)[1]) == (64, 64)
+
+        with pytest.raises(InvalidImageError, match='손상'):
+            validator.comprehensive_validation(data)
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    def test_comprehensive_validation_opens_pil_once(self):
+        """종합 검증 - 허용 형식 이미지는 Image.open 1회로 형식·크기 확인"""
+        from unittest.mock import patch
+        from backend.utils.advanced_validators import ImageValidator
+
+        data = make_image_bytes(64, 64, 'red', fmt='PNG')
+
+        with patch('backend.utils.advanced_validators.Image.open',
+                   wraps=Image.open) as mock_open:
+            assert ImageValidator().comprehensive_validation(data) == (True, None)
+
+        mock_open.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    @pytest.mark.security
+    def test_fused_validate_rejects_format_outside_allowlist(self):
+        """단일 패스 검증 - 매직 바이트는 통과해도 PIL 형식이 허용 목록 밖이면 거절"""
+        from unittest.mock import patch
+        from backend.utils.advanced_validators import ImageValidator
+        from backend.utils.exceptions import InvalidImageError
+
+        data = make_image_bytes(64, 64, 'red', fmt='PNG')
+
+        with patch('backend.utils.advanced_validators.Image.open') as mock_open:
+            mock_open.return_value.__enter__.return_value.format = 'MPO'
+            mock_open.return_value.__enter__.return_value.size = (64, 64)
+            with pytest.raises(InvalidImageError, match='유효한 이미지 형식'):
+                ImageValidator().fused_validate(data)
+
+    @pytest.mark.unit
+    @pytest.mark.validation
+    @pytest.mark.parametrize('img_format, save_kwargs', [
+        ('JPEG', {}),
+        ('JPEG', {'progressive': True}),
+        ('PNG', {}),
+        ('GIF', {}),
+        ('WEBP', {'lossless': False}),
+        ('WEBP', {'lossless': True}),
+    ])
+    def test_peek_dims_matches_pil(self, img_format, save_kwargs):
+        """헤더 기반 크기 추출 - PIL이 읽은 크기와 일치"""
+        from backend.utils.advanced_validators import ImageValidator
+
+        validator = ImageValidator()
+
+        img = Image.new('RGB', (301, 37), color='white')
+        img_bytes = io.BytesIO()
+        img.save(img_bytes, format=img_format, **save_kwargs)
+        data = img_bytes.getvalue()
+
+        _, detected = validator.validate_magic_bytes(data)
+
+        assert validator._peek_dims(data, detected) == (301, 37)
+
+
+class TestJSONProvider:
+    """orjson JSONProvider 테스트"""
+
+    @pytest.mark.unit
+    def test_orjson_provider_serializes_numpy(self):
+        """OrjsonProvider - NumPy float32 / 배열 직렬화"""
+        import numpy as np
+        from flask import Flask
+        from backend.utils.json_provider import OrjsonProvider, ORJSON_AVAILABLE
+
+        if not ORJSON_AVAILABLE:
+            pytest.skip("orjson 미설치 환경")
+
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+
+        with app.app_context():
+            response = app.json.response({
+                'className': '정상',
+                'probability': np.float32(0.5),
+                'scores': np.array([0.25, 0.75], dtype=np.float32)
+            })
+
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {
+            'className': '정상',
+            'probability': 0.5,
+            'scores': [0.25, 0.75]
+        }
+
+    @pytest.mark.unit
+    def test_orjson_provider_matches_default_key_order(self):
+        """OrjsonProvider - 기본 프로바이더처럼 키 정렬, sort_keys / indent 인자 반영"""
+        import json
+        from flask import Flask
+        from backend.utils.json_provider import OrjsonProvider, ORJSON_AVAILABLE
+
+        if not ORJSON_AVAILABLE:
+            pytest.skip("orjson 미설치 환경")
+
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+        obj = {'success': True, 'error': 'x', 'data': {'b': 1, 'a': 2}}
+
+        with app.app_context():
+            body = app.json.response(obj).get_data(as_text=True)
+
+        assert body == json.dumps(obj, sort_keys=True, separators=(',', ':'))
+        assert app.json.dumps(obj, sort_keys=False) == json.dumps(obj, separators=(',', ':'))
+        assert app.json.dumps(obj, indent=2) == json.dumps(obj, sort_keys=True, indent=2)
+
+
+class TestPreprocess:
+    """ONNX 입력 전처리 테스트"""
+
+    @pytest.mark.unit
+    def test_preprocess_matches_reference_normalization(self):
+        """preprocess_bytes_to_tensor - (x / 255 - mean) / std 와 수치적으로 동일"""
+        import numpy as np
+        from backend.utils.image_processor import (
+            preprocess_bytes_to_tensor, IMAGENET_MEAN, IMAGENET_STD
+        )
+
+        rng = np.random.default_rng(0)
+        img = Image.fromarray(rng.integers(0, 256, (300, 250, 3), dtype=np.uint8))
+        img_bytes = io.BytesIO()
+        img.save(img_bytes, format='PNG')
+
+        tensor = preprocess_bytes_to_tensor(img_bytes.getvalue())
+
+        pixels = np.asarray(img.resize((224, 224), Image.BICUBIC), dtype=np.float32)
+        expected = (pixels / 255.0 - IMAGENET_MEAN) / IMAGENET_STD
+
+        assert tensor.shape == (1, 224, 224, 3)
+        assert tensor.dtype == np.float32
+        np.testing.assert_allclose(tensor[0], expected, atol=1e-5)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_preprocess_batch_matches_single(self, max_workers):
+        """preprocess_batch - 배치 결과의 각 슬롯이 단일 전처리 결과와 동일"""
+        import numpy as np
+        from backend.utils.image_processor import (
+            preprocess_batch, preprocess_bytes_to_tensor
+        )
+
+        rng = np.random.default_rng(1)
+        images = []
+        for size in [(300, 250), (224, 224), (64, 480)]:
+            buf = io.BytesIO()
+            Image.fromarray(
+                rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)
+            ).save(buf, format='PNG')
+            images.append(buf.getvalue())
+
+        batch = preprocess_batch(images, max_workers=max_workers)
+
+        assert batch.shape == (3, 224, 224, 3)
+        assert batch.dtype == np.float32
+        for i, data in enumerate(images):
+            np.testing.assert_array_equal(batch[i], preprocess_bytes_to_tensor(data)[0])
+
+    @pytest.mark.unit
+    def test_preprocess_large_jpeg_matches_full_decode(self):
+        """preprocess_bytes_to_tensor - 고주파 대형 JPEG도 전체 디코딩 + Bicubic 결과와 일치"""
+        import numpy as np
+        from backend.utils.image_processor import (
+            preprocess_bytes_to_tensor, IMAGENET_MEAN, IMAGENET_STD
+        )
+
+        # 줄무늬 + 노이즈: DCT 축소(draft) 시 편차가 크게 드러나는 고주파 영상
+        rng = np.random.default_rng(7)
+        y, x = np.mgrid[0:2000, 0:1800]
+        stripes = np.where((x // 3 + y // 5) % 2 == 0, 200, 40)
+        noise = rng.integers(-30, 31, (2000, 1800, 3))
+        pixels = np.clip(stripes[..., None] + noise, 0, 255).astype(np.uint8)
+        img_bytes = io.BytesIO()
+        Image.fromarray(pixels).save(img_bytes, format='JPEG', quality=92)
+        data = img_bytes.getvalue()
+
+        tensor = preprocess_bytes_to_tensor(data)
+
+        full = Image.open(io.BytesIO(data)).convert('RGB').resize((224, 224), Image.BICUBIC)
+        expected = (np.asarray(full, dtype=np.float32) / 255.0 - IMAGENET_MEAN) / IMAGENET_STD
+
+        # 부동소수점 연산 순서 차이만 허용
+        np.testing.assert_allclose(tensor[0], expected, atol=1e-5)
+
+
+class TestHealthChecker:
+    """헬스체커 테스트"""
+
+    @pytest.mark.unit
+    def test_system_resources_reused_within_ttl(self):
+        """check_system_resources - TTL 내 반복 호출은 측정 결과 재사용"""
+        from unittest.mock import patch
+        from backend.utils.health import HealthChecker
+        import psutil
+
+        checker = HealthChecker()
+
+        with patch('backend.utils.health.psutil.virtual_memory',
+                   wraps=psutil.virtual_memory) as mock_memory:
+            first = checker.check_system_resources()
+            second = checker.check_system_resources()
+
+        assert first['status'] == 'healthy'
+        assert second is first
+        mock_memory.assert_called_once()
+
+    @pytest.mark.unit
+    def test_cpu_samplers_keep_independent_windows(self):
+        """CpuSampler - 한 샘플러의 측정이 다른 샘플러의 기준점을 리셋하지 않음"""
+        from collections import namedtuple
+        from unittest.mock import patch
+        from backend.utils.health import CpuSampler
+
+        Times = namedtuple('Times', 'user system idle')
+        times = iter([
+            Times(0.0, 0.0, 0.0),      # a 기준점
+            Times(0.0, 0.0, 0.0),      # b 기준점
+            Times(5.0, 0.0, 5.0),      # a.sample() — 50%
+            Times(15.0, 0.0, 5.0),     # b.sample() — 자신의 기준점부터 75%
+        ])
+
+        with patch('backend.utils.health.psutil.cpu_times', side_effect=lambda: next(times)):
+            a, b = CpuSampler(), CpuSampler()
+            assert a.sample() == pytest.approx(50.0)
+            assert b.sample() == pytest.approx(75.0)   # a 기준이면 100%